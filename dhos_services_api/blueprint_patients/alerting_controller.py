@@ -3,7 +3,7 @@ from typing import Optional
 
 from flask_batteries_included.sqldb import db
 from she_logging import logger
-from sqlalchemy.orm import Query, subqueryload
+from sqlalchemy.orm import Query, selectinload
 
 from dhos_services_api.blueprint_patients.patient_controller import DIABETES_CODES
 from dhos_services_api.sqlmodels import (
@@ -79,7 +79,7 @@ def _build_query(cutoff_date: date) -> Query:
     ).order_by(Patient.uuid, Diagnosis.uuid)
 
     query = query.options(
-        subqueryload(Diagnosis.readings_plan).joinedload(ReadingsPlan.changes),
+        selectinload(Diagnosis.readings_plan).joinedload(ReadingsPlan.changes),
     )
     return query
 
@@ -5,6 +5,7 @@ from neomodel import db
 from she_logging import logger
 
 from dhos_services_api.blueprint_patients.patient_controller_neo import DIABETES_CODES
+from dhos_services_api.helpers.responses import by_created
 
 
 class ReadingsPlanSchema(TypedDict):
@@ -38,7 +39,7 @@ def _fix_patient(neopatient: NeoPatientSchema) -> PatientSchema:
     # Sort them oldest first, and replace the missing values from the last value set.
     # If there are missing values at the start then ignore those records as they are
     # invalid history. Also ignore records where nothing changed.
-    readings_plans = sorted(neopatient["readings_plans"], key=lambda r: r["created"])
+    readings_plans = sorted(neopatient["readings_plans"], key=by_created)
     fixed_plans: List[ReadingsPlanSchema] = []
     days_per_week_to_take_readings, readings_per_day = None, None
     last_readings_plan: Optional[ReadingsPlanSchema] = None
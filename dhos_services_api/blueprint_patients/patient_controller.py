@@ -86,7 +86,7 @@ def retrieve_patients_by_uuids(
     query = query.filter(filter_patient_active_on_product(product_name))
 
     if compact:
-        # N.B. Query options using subqueryload must be sorted on a unique field
+        # N.B. Sorted on a unique field so results come back in a stable order
         query = query.options(*query_options_compact_patient_response()).order_by(
             Patient.uuid
         )
@@ -121,11 +121,11 @@ def get_patient_abbreviated(patient_uuid: str) -> dict:
     :return: The patient model as a dict, only containing location ID, diagnosis sct codes and plans
     """
     record_opt = joinedload(Patient.record)
-    diagnoses_opt = record_opt.subqueryload(sqlmodels.Record.diagnoses)
-    management_plan_opt = diagnoses_opt.subqueryload(
+    diagnoses_opt = record_opt.selectinload(sqlmodels.Record.diagnoses)
+    management_plan_opt = diagnoses_opt.selectinload(
         sqlmodels.Diagnosis.management_plan
     )
-    management_plan_doses_opt = management_plan_opt.subqueryload(
+    management_plan_doses_opt = management_plan_opt.selectinload(
         sqlmodels.ManagementPlan.doses
     ).joinedload(sqlmodels.Dose.changes)
 
@@ -175,6 +175,10 @@ def get_patient_by_record_uuid(record_id: str, compact: bool) -> dict:
     query: Query = (
         db.session.query(Patient).join(Patient.record).filter(Record.uuid == record_id)
     )
+    if compact:
+        query = query.options(*query_options_compact_patient_response())
+    else:
+        query = query.options(*query_options_full_patient_response())
     response = query.first()
     if response is None:
         raise EntityNotFoundException(
@@ -211,9 +215,13 @@ def create_patient(product_name: str, patient_details: dict) -> dict:
         ensure_unique_nhs_number(nhs_number, product_name)
 
     patient = Patient.new(**patient_details)
+    # Committing expires the patient, so take the uuid before it is refreshed.
+    patient_uuid: str = patient.uuid
     db.session.commit()
 
-    return pydantic_models.PatientResponse.from_orm(patient).dict()
+    return pydantic_models.PatientResponse.from_orm(
+        _reload_full_patient(patient_uuid)
+    ).dict()
 
 
 def update_patient(patient_uuid: str, patient_details: dict) -> dict:
@@ -243,7 +251,18 @@ def update_patient(patient_uuid: str, patient_details: dict) -> dict:
         )
 
     db.session.commit()
-    return pydantic_models.PatientResponse.from_orm(patient).dict()
+    return pydantic_models.PatientResponse.from_orm(
+        _reload_full_patient(patient_uuid)
+    ).dict()
+
+
+def _reload_full_patient(patient_uuid: str) -> Patient:
+    """
+    Committing expires the patient, so reload it with the full response preloaded rather
+    than lazily loading every relationship one at a time while it is serialised.
+    """
+    query: Query = db.session.query(Patient).filter(Patient.uuid == patient_uuid)
+    return query.options(*query_options_full_patient_response()).one()
 
 
 def remove_from_patient(patient_uuid: str, fields_to_remove: dict) -> dict:
@@ -556,13 +575,13 @@ def search_patients(
         )
 
     if expanded:
-        # N.B. Query options using subqueryload must be sorted on a unique field
+        # N.B. Sorted on a unique field so results come back in a stable order
         query = query.options(*query_options_full_patient_response()).order_by(
             Patient.uuid
         )
         return [pydantic_models.PatientSearchResponse.from_orm(p).dict() for p in query]
     else:
-        # N.B. Query options using subqueryload must be sorted on a unique field
+        # N.B. Sorted on a unique field so results come back in a stable order
         query = query.options(*query_options_compact_patient_response()).order_by(
             Patient.uuid
         )
@@ -578,9 +597,9 @@ def patient_list(product_name: str, location_uuids: list[str]) -> list[dict]:
         filter_patient_active_on_product(product_name),
         Patient.locations.overlap(location_uuids),
     )
-    # Ensure all related records are pulled in either with join or as separate subqueries
+    # Ensure all related records are pulled in either with join or as separate IN queries
 
-    # N.B. Query options using subqueryload must be sorted on a unique field
+    # N.B. Sorted on a unique field so results come back in a stable order
     query = query.options(*query_options_patient_list()).order_by(Patient.uuid)
 
     return [
@@ -632,9 +651,11 @@ def set_patient_monitored_by_clinician(
 
     if monitored_by_clinician:
         product.start_monitoring()
+        db.session.commit()
         audit.record_patient_monitored(patient_id=patient_id, product_id=product_id)
     else:
         product.stop_monitoring()
+        db.session.commit()
         audit.record_patient_not_monitored_anymore(
             patient_id=patient_id, product_id=product_id
         )
@@ -0,0 +1,57 @@
+"""
+Date and datetime conversions used by model properties. These produce the same
+results as the flask-batteries-included timestamp helpers, but use the
+C-implemented isoformat()/fromisoformat() for the common case and only fall back
+to the flask-batteries-included parsers (which also produce their error messages)
+for anything else.
+"""
+from datetime import date, datetime
+from typing import Optional
+
+from flask_batteries_included.helpers import timestamp
+
+
+def parse_iso8601_to_date(iso8601: Optional[str]) -> Optional[date]:
+    if not iso8601:
+        return None
+    try:
+        return date.fromisoformat(iso8601)
+    except (TypeError, ValueError):
+        return timestamp.parse_iso8601_to_date(iso8601)
+
+
+def parse_date_to_iso8601(d: Optional[date]) -> Optional[str]:
+    if d is None:
+        return None
+    return d.isoformat()
+
+
+def parse_datetime_to_iso8601(dt: Optional[datetime]) -> Optional[str]:
+    """
+    Same output as flask-batteries-included's parse_datetime_to_iso8601 (millisecond
+    precision, "Z" for UTC), using a single isoformat() call rather than three strftime()s.
+    """
+    if dt is None:
+        return None
+    iso8601 = dt.isoformat(timespec="milliseconds")
+    if iso8601.endswith("+00:00"):
+        return iso8601[:-6] + "Z"
+    return iso8601
+
+
+def parse_iso8601_to_datetime(iso8601: Optional[str]) -> Optional[datetime]:
+    if not iso8601:
+        return None
+    # Only the canonical form (e.g. 2000-01-01T01:01:01.123Z) takes the fast path, as
+    # fromisoformat() accepts some strings the flask-batteries-included parser rejects.
+    if iso8601[10:11] == "T" and "." in iso8601:
+        try:
+            parsed = datetime.fromisoformat(
+                iso8601[:-1] + "+00:00" if iso8601.endswith("Z") else iso8601
+            )
+        except ValueError:
+            pass
+        else:
+            if parsed.tzinfo is not None:
+                return parsed
+    return timestamp.parse_iso8601_to_datetime(iso8601)
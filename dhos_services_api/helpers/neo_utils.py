@@ -1,7 +1,7 @@
-from typing import Any, Optional, Type, TypeVar
+from typing import Any, List, Optional, Sequence, Type, TypeVar
 
 from flask_batteries_included.helpers.error_handler import EntityNotFoundException
-from neomodel import StructuredNode
+from neomodel import StructuredNode, db
 
 T = TypeVar("T", bound=StructuredNode)
 
@@ -26,3 +26,87 @@ def get_node_or_404(model: Type[T], **filter_by: Any) -> T:
     if not node:
         raise EntityNotFoundException(f"{model.__name__} {filter_by} not found")
     return node
+
+
+def get_nodes_or_404(model: Type[T], uuids: Sequence[str]) -> List[T]:
+    """
+    :param model: node class
+    :param uuids: uuids of the nodes to fetch
+    :return: the matching nodes, fetched with a single query, otherwise raises 404
+    """
+    if not uuids:
+        return []
+    nodes: Any = model.nodes  # type:ignore
+    found = {node.uuid: node for node in nodes.filter(uuid__in=list(uuids))}
+    for uuid in uuids:
+        if uuid not in found:
+            raise EntityNotFoundException(
+                f"{model.__name__} {{'uuid': {uuid!r}}} not found"
+            )
+    return [found[uuid] for uuid in uuids]
+
+
+def _relation_type(source: StructuredNode, relation: str) -> str:
+    definition = type(source).defined_properties(aliases=False, properties=False)
+    return definition[relation].definition["relation_type"]
+
+
+def create_related_nodes(
+    source: StructuredNode, relation: str, nodes: Sequence[StructuredNode]
+) -> None:
+    """
+    Save new nodes and connect them to an already saved node using a single query,
+    rather than a save() and connect() round-trip for every node.
+    :param source: saved node the new nodes are connected from
+    :param relation: name of the relationship on the source node
+    :param nodes: unsaved nodes, all of the same class
+    """
+    if not nodes:
+        return
+
+    for node in nodes:
+        node.pre_save()
+
+    node_class = type(nodes[0])
+    query = f"""
+    MATCH (source) WHERE id(source) = $source_id
+    UNWIND $rows AS row
+    CREATE (source)-[:{_relation_type(source, relation)}]->(n:{':'.join(node_class.inherited_labels())})
+    SET n = row
+    RETURN id(n)
+    """
+    results, meta = db.cypher_query(
+        query,
+        {
+            "source_id": source.id,
+            "rows": [
+                node_class.deflate(node.__properties__, node, skip_empty=True)
+                for node in nodes
+            ],
+        },
+    )
+    for node, (node_id,) in zip(nodes, results):
+        node.id = node_id
+
+
+def connect_nodes(
+    source: StructuredNode, relation: str, nodes: Sequence[StructuredNode]
+) -> None:
+    """
+    Connect already saved nodes to a node using a single query, rather than a
+    connect() round-trip for every node.
+    :param source: saved node the nodes are connected from
+    :param relation: name of the relationship on the source node
+    :param nodes: saved nodes
+    """
+    if not nodes:
+        return
+
+    query = f"""
+    MATCH (source) WHERE id(source) = $source_id
+    MATCH (n) WHERE id(n) IN $node_ids
+    CREATE (source)-[:{_relation_type(source, relation)}]->(n)
+    """
+    db.cypher_query(
+        query, {"source_id": source.id, "node_ids": [node.id for node in nodes]}
+    )
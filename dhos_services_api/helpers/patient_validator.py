@@ -1,10 +1,19 @@
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterable, List
 
 from flask_batteries_included.helpers import timestamp
 
 from dhos_services_api.models.patient import Patient
 
 
+def _any_open_product(patients: Iterable[Patient], product_name: str) -> bool:
+    # Stops at the first match rather than fetching every patient's products.
+    return any(
+        x.product_name == product_name and x.closed_date_ is None
+        for p in patients
+        for x in p.dh_products
+    )
+
+
 class PatientValidator:
 
     whitelist = (
@@ -40,14 +49,7 @@ class PatientValidator:
             hospital_number=self.hospital_number
         )
 
-        matching_patients = [
-            p
-            for p in patients_by_mrn
-            for x in p.dh_products
-            if x.product_name == product_name and x.closed_date_ is None
-        ]
-
-        return len(matching_patients) > 0
+        return _any_open_product(patients_by_mrn, product_name)
 
     def exists_by_details(self, product_name: str) -> bool:
 
@@ -66,25 +68,11 @@ class PatientValidator:
 
         patients = Patient.nodes.filter(dob_=self.dob, **fields)
 
-        matching_patients = [
-            p
-            for p in patients
-            for x in p.dh_products
-            if x.product_name == product_name and x.closed_date_ is None
-        ]
-
-        return len(matching_patients) > 0
+        return _any_open_product(patients, product_name)
 
     @staticmethod
     def exists_by_nhs_number(nhs_number: str, product_name: str) -> bool:
 
         patients_by_nhs_no: List[Patient] = Patient.nodes.filter(nhs_number=nhs_number)
 
-        matching_patients = [
-            p
-            for p in patients_by_nhs_no
-            for x in p.dh_products
-            if x.product_name == product_name and x.closed_date_ is None
-        ]
-
-        return len(matching_patients) > 0
+        return _any_open_product(patients_by_nhs_no, product_name)
@@ -6,6 +6,7 @@ Query results may be:
     A list of dict
     A list of uuid strings
 """
+from operator import itemgetter
 from typing import Any, Callable, Dict, List, Type, Union
 
 from neo4j import Node
@@ -13,6 +14,9 @@ from neomodel import StructuredNode
 
 QueryResponse = Union[Node, Dict]
 
+# Sort key for lists of related node dicts.
+by_created = itemgetter("created")
+
 
 def validate_uuid_list(values: List[str]) -> List[str]:
     if not all(isinstance(v, str) for v in values):
@@ -1,18 +1,14 @@
 import codecs
 import itertools
 import string
+from functools import cache
 from typing import Any, Dict, List, Optional
 
 from Cryptodome.Protocol.KDF import scrypt
 from Cryptodome.Random import random as crr
-from flask_batteries_included.helpers.timestamp import (
-    parse_date_to_iso8601,
-    parse_iso8601_to_date,
-)
 from neomodel import (
     ArrayProperty,
     BooleanProperty,
-    DateProperty,
     EmailProperty,
     OneOrMore,
     RelationshipFrom,
@@ -23,10 +19,11 @@ from neomodel import (
 )
 from she_logging import logger
 
+from dhos_services_api.helpers.dates import parse_date_to_iso8601, parse_iso8601_to_date
 from dhos_services_api.helpers.responses import QueryResponse, response_to_dict
 from dhos_services_api.models.drayson_health_product import ClinicianProduct
 from dhos_services_api.models.mixins.user import UserMixin
-from dhos_services_api.neodb import NeomodelIdentifier
+from dhos_services_api.neodb import IsoDateProperty, NeomodelIdentifier
 
 
 class Clinician(NeomodelIdentifier, UserMixin, StructuredNode):
@@ -42,7 +39,7 @@ class Clinician(NeomodelIdentifier, UserMixin, StructuredNode):
     agency_staff_employee_number = StringProperty()
     booking_reference = StringProperty()
 
-    contract_expiry_eod_date_ = DateProperty(db_property="contract_expiry_eod_date")
+    contract_expiry_eod_date_ = IsoDateProperty(db_property="contract_expiry_eod_date")
 
     locations: List[str] = ArrayProperty(StringProperty(), default=[])
     products = RelationshipTo(
@@ -90,6 +87,7 @@ class Clinician(NeomodelIdentifier, UserMixin, StructuredNode):
         return obj
 
     @classmethod
+    @cache
     def schema(cls) -> Dict:
         return {
             "optional": {
@@ -199,52 +197,55 @@ class Clinician(NeomodelIdentifier, UserMixin, StructuredNode):
         if self.analytics_consent is not None:
             analytics_consent = {"analytics_consent": self.analytics_consent}
 
-        return {
-            "job_title": self.job_title,
-            "send_entry_identifier": self.send_entry_identifier,
-            "nhs_smartcard_number": self.nhs_smartcard_number,
-            "professional_registration_number": self.professional_registration_number,
-            "agency_name": self.agency_name,
-            "agency_staff_employee_number": self.agency_staff_employee_number,
-            "email_address": self.email_address,
-            "locations": self.locations,
-            "bookmarks": self.bookmarks,
-            "bookmarked_patients": [p.uuid for p in self.bookmarked_patients],
-            "terms_agreement": self._latest_terms_agreement_by_product(),
-            "login_active": self.login_active,
-            "groups": self.groups,
-            "products": [p.to_dict() for p in self.products],
-            "can_edit_ews": self.can_edit_ews,
-            "can_edit_encounter": self.can_edit_encounter,
-            "contract_expiry_eod_date": self.contract_expiry_eod_date,
-            **analytics_consent,
-            **self.pack_identifier(),
-            **self.pack_user(),
-        }
+        return self.pack_identifier(
+            {
+                "job_title": self.job_title,
+                "send_entry_identifier": self.send_entry_identifier,
+                "nhs_smartcard_number": self.nhs_smartcard_number,
+                "professional_registration_number": self.professional_registration_number,
+                "agency_name": self.agency_name,
+                "agency_staff_employee_number": self.agency_staff_employee_number,
+                "email_address": self.email_address,
+                "locations": self.locations,
+                "bookmarks": self.bookmarks,
+                "bookmarked_patients": [p.uuid for p in self.bookmarked_patients],
+                "terms_agreement": self._latest_terms_agreement_by_product(),
+                "login_active": self.login_active,
+                "groups": self.groups,
+                "products": [p.to_dict() for p in self.products],
+                "can_edit_ews": self.can_edit_ews,
+                "can_edit_encounter": self.can_edit_encounter,
+                "contract_expiry_eod_date": self.contract_expiry_eod_date,
+                **analytics_consent,
+                **self.pack_user(),
+            }
+        )
 
     def to_compact_dict(self) -> Dict[str, str]:
-        return {
-            "job_title": self.job_title,
-            "email_address": self.email_address,
-            "first_name": self.first_name,
-            "last_name": self.last_name,
-            **self.compack_identifier(),
-        }
+        return self.compack_identifier(
+            {
+                "job_title": self.job_title,
+                "email_address": self.email_address,
+                "first_name": self.first_name,
+                "last_name": self.last_name,
+            }
+        )
 
     def to_dict_no_relations(self) -> Dict:
         return self.to_compact_dict()
 
     def to_auth_dict(self) -> Dict[str, Any]:
-        return {
-            "job_title": self.job_title,
-            "send_entry_identifier": self.send_entry_identifier,
-            "locations": self.locations,
-            "login_active": self.login_active,
-            "contract_expiry_eod_date": self.contract_expiry_eod_date,
-            "groups": self.groups,
-            "products": [p.to_dict() for p in self.products],
-            **self.pack_identifier(),
-        }
+        return self.pack_identifier(
+            {
+                "job_title": self.job_title,
+                "send_entry_identifier": self.send_entry_identifier,
+                "locations": self.locations,
+                "login_active": self.login_active,
+                "contract_expiry_eod_date": self.contract_expiry_eod_date,
+                "groups": self.groups,
+                "products": [p.to_dict() for p in self.products],
+            }
+        )
 
     def to_login_dict(self) -> Dict[str, Any]:
 
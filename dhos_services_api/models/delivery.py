@@ -1,10 +1,10 @@
+from functools import cache
 from typing import Any, Dict, Optional
 
-from flask_batteries_included.helpers import schema, timestamp
+from flask_batteries_included.helpers import schema
 from neomodel import (
     ArrayProperty,
     BooleanProperty,
-    DateProperty,
     IntegerProperty,
     RelationshipTo,
     StringProperty,
@@ -13,8 +13,9 @@ from neomodel import (
 )
 
 import dhos_services_api.models.patient
+from dhos_services_api.helpers.dates import parse_date_to_iso8601, parse_iso8601_to_date
 from dhos_services_api.helpers.responses import QueryResponse, response_to_dict
-from dhos_services_api.neodb import NeomodelIdentifier
+from dhos_services_api.neodb import IsoDateProperty, NeomodelIdentifier
 
 _MARKER: Any = object()
 
@@ -31,7 +32,7 @@ class Delivery(NeomodelIdentifier, StructuredNode):
     apgar_1_minute = IntegerProperty()
     apgar_5_minute = IntegerProperty()
     feeding_method = StringProperty()
-    date_of_termination_ = DateProperty()
+    date_of_termination_ = IsoDateProperty()
 
     patient = RelationshipTo(".patient.Baby", "IS_PATIENT", cardinality=ZeroOrOne)
 
@@ -56,17 +57,16 @@ class Delivery(NeomodelIdentifier, StructuredNode):
 
     @property
     def date_of_termination(self) -> Optional[str]:
-        if self.date_of_termination_ is None:
-            return None
-        return timestamp.parse_date_to_iso8601(self.date_of_termination_)
+        return parse_date_to_iso8601(self.date_of_termination_)
 
     @date_of_termination.setter
     def date_of_termination(self, value: Optional[str]) -> None:
         if value is None:
             return
-        self.date_of_termination_ = timestamp.parse_iso8601_to_date(value)
+        self.date_of_termination_ = parse_iso8601_to_date(value)
 
     @classmethod
+    @cache
     def schema(cls) -> Dict[str, Dict[str, Any]]:
         return {
             "optional": {
@@ -101,50 +101,35 @@ class Delivery(NeomodelIdentifier, StructuredNode):
         }
 
     def to_dict_no_relations(self, patient: Dict = None) -> Dict:
-        return {
-            "birth_outcome": self.birth_outcome,
-            "outcome_for_baby": self.outcome_for_baby,
-            "neonatal_complications": self.neonatal_complications,
-            "neonatal_complications_other": self.neonatal_complications_other,
-            "admitted_to_special_baby_care_unit": self.admitted_to_special_baby_care_unit,
-            "birth_weight_in_grams": self.birth_weight_in_grams,
-            "length_of_postnatal_stay_for_baby": self.length_of_postnatal_stay_for_baby,
-            "apgar_1_minute": self.apgar_1_minute,
-            "apgar_5_minute": self.apgar_5_minute,
-            "feeding_method": self.feeding_method,
-            "date_of_termination": self.date_of_termination,
-            "patient": patient,
-            **self.pack_identifier(),
-        }
+        return self.pack_identifier(
+            {
+                "birth_outcome": self.birth_outcome,
+                "outcome_for_baby": self.outcome_for_baby,
+                "neonatal_complications": self.neonatal_complications,
+                "neonatal_complications_other": self.neonatal_complications_other,
+                "admitted_to_special_baby_care_unit": self.admitted_to_special_baby_care_unit,
+                "birth_weight_in_grams": self.birth_weight_in_grams,
+                "length_of_postnatal_stay_for_baby": self.length_of_postnatal_stay_for_baby,
+                "apgar_1_minute": self.apgar_1_minute,
+                "apgar_5_minute": self.apgar_5_minute,
+                "feeding_method": self.feeding_method,
+                "date_of_termination": self.date_of_termination,
+                "patient": patient,
+            }
+        )
 
     def to_dict(self) -> Dict[str, Any]:
-        return {
-            "birth_outcome": self.birth_outcome,
-            "outcome_for_baby": self.outcome_for_baby,
-            "neonatal_complications": self.neonatal_complications,
-            "neonatal_complications_other": self.neonatal_complications_other,
-            "admitted_to_special_baby_care_unit": self.admitted_to_special_baby_care_unit,
-            "birth_weight_in_grams": self.birth_weight_in_grams,
-            "length_of_postnatal_stay_for_baby": self.length_of_postnatal_stay_for_baby,
-            "apgar_1_minute": self.apgar_1_minute,
-            "apgar_5_minute": self.apgar_5_minute,
-            "feeding_method": self.feeding_method,
-            "date_of_termination": self.date_of_termination,
-            "patient": self.patient.single().to_dict()
-            if self.patient.single() is not None
-            else None,
-            **self.pack_identifier(),
-        }
+        patient = self.patient.single()
+        return self.to_dict_no_relations(
+            patient=patient.to_dict() if patient is not None else None
+        )
 
     def to_compact_dict(self, patient: Dict = _MARKER) -> Dict:
         if patient is _MARKER:
-            patient = (
-                self.patient.single().to_compact_dict()
-                if self.patient.single() is not None
-                else None
-            )
+            baby = self.patient.single()
+            patient = baby.to_compact_dict() if baby is not None else None
 
-        return {"patient": patient, **self.compack_identifier()}
+        return self.compack_identifier({"patient": patient})
 
     @classmethod
     def convert_response_to_dict(cls, response: QueryResponse, method: str) -> Dict:
@@ -1,13 +1,9 @@
+from functools import cache
 from typing import Any, Dict, List, Optional
 
 from flask_batteries_included.helpers import schema
-from flask_batteries_included.helpers.timestamp import (
-    parse_date_to_iso8601,
-    parse_iso8601_to_date,
-)
 from neomodel import (
     ArrayProperty,
-    DateProperty,
     IntegerProperty,
     RelationshipTo,
     StringProperty,
@@ -15,8 +11,9 @@ from neomodel import (
     ZeroOrOne,
 )
 
+from dhos_services_api.helpers.dates import parse_date_to_iso8601, parse_iso8601_to_date
 from dhos_services_api.helpers.responses import QueryResponse, response_to_dict
-from dhos_services_api.neodb import NeomodelIdentifier
+from dhos_services_api.neodb import IsoDateProperty, NeomodelIdentifier
 
 from .management_plan import ManagementPlan
 from .observable_entity import ObservableEntity
@@ -28,9 +25,9 @@ class Diagnosis(NeomodelIdentifier, StructuredNode):
     sct_code = StringProperty()
     diagnosis_other = StringProperty()
 
-    diagnosed_ = DateProperty()
-    resolved_ = DateProperty()
-    presented_ = DateProperty()
+    diagnosed_ = IsoDateProperty()
+    resolved_ = IsoDateProperty()
+    presented_ = IsoDateProperty()
     episode = IntegerProperty()
 
     diagnosis_tool = ArrayProperty(StringProperty(), default=[])
@@ -105,6 +102,7 @@ class Diagnosis(NeomodelIdentifier, StructuredNode):
         return obj
 
     @classmethod
+    @cache
     def schema(cls) -> Dict[str, Dict[str, Any]]:
         return {
             "optional": {
@@ -145,23 +143,24 @@ class Diagnosis(NeomodelIdentifier, StructuredNode):
     ) -> Dict:
         """to_dict_no_relations: convert to a dictionary but will not touch related nodes."""
 
-        return {
-            "sct_code": self.sct_code,
-            "diagnosis_other": self.diagnosis_other,
-            "diagnosed": self.diagnosed,
-            "resolved": self.resolved,
-            "episode": self.episode,
-            "presented": self.presented,
-            "diagnosis_tool": self.diagnosis_tool,
-            "diagnosis_tool_other": self.diagnosis_tool_other,
-            "risk_factors": self.risk_factors,
-            "observable_entities": []
-            if observable_entities is None
-            else observable_entities,
-            "management_plan": management_plan,
-            "readings_plan": readings_plan,
-            **self.pack_identifier(),
-        }
+        return self.pack_identifier(
+            {
+                "sct_code": self.sct_code,
+                "diagnosis_other": self.diagnosis_other,
+                "diagnosed": self.diagnosed,
+                "resolved": self.resolved,
+                "episode": self.episode,
+                "presented": self.presented,
+                "diagnosis_tool": self.diagnosis_tool,
+                "diagnosis_tool_other": self.diagnosis_tool_other,
+                "risk_factors": self.risk_factors,
+                "observable_entities": []
+                if observable_entities is None
+                else observable_entities,
+                "management_plan": management_plan,
+                "readings_plan": readings_plan,
+            }
+        )
 
     def to_dict(self) -> Dict:
         """to_dict: convert to a dictionary."""
@@ -189,12 +188,13 @@ class Diagnosis(NeomodelIdentifier, StructuredNode):
         readings_plan: Dict = None,
         observable_entities: List[Dict] = None,
     ) -> Dict:
-        return {
-            "management_plan": management_plan,
-            "sct_code": self.sct_code,
-            "diagnosed": self.diagnosed,
-            **self.compack_identifier(),
-        }
+        return self.compack_identifier(
+            {
+                "management_plan": management_plan,
+                "sct_code": self.sct_code,
+                "diagnosed": self.diagnosed,
+            }
+        )
 
     @classmethod
     def convert_response_to_dict(cls, response: QueryResponse, method: str) -> Dict:
@@ -1,3 +1,4 @@
+from functools import cache
 from typing import Any, Dict, Iterable, List
 
 from flask_batteries_included.helpers import schema
@@ -38,6 +39,7 @@ class Dose(NeomodelIdentifier, StructuredNode):
         return obj
 
     @classmethod
+    @cache
     def schema(cls) -> Dict[str, Dict[str, type]]:
         return {
             "optional": {"routine_sct_code": str},
@@ -123,42 +125,20 @@ class Dose(NeomodelIdentifier, StructuredNode):
         plan.save()
         return False
 
-    @property
-    def created_by(self) -> str:
-        return self.created_by_
-
-    @created_by.setter
-    def created_by(self, v: str) -> None:
-        self.created_by_ = v
-
-    @property
-    def modified_by(self) -> str:
-        return self.modified_by_
-
-    @modified_by.setter
-    def modified_by(self, v: str) -> None:
-        self.modified_by_ = v
-
     def to_dict_no_relations(self, changes: Iterable[Dict] = None) -> Dict:
         """Convert to dict but don't follow any relations"""
-        return {
-            "medication_id": self.medication_id,
-            "dose_amount": self.dose_amount,
-            "routine_sct_code": self.routine_sct_code,
-            "changes": [] if changes is None else changes,
-            **self.pack_identifier(),
-        }
+        return self.pack_identifier(
+            {
+                "medication_id": self.medication_id,
+                "dose_amount": self.dose_amount,
+                "routine_sct_code": self.routine_sct_code,
+                "changes": [] if changes is None else changes,
+            }
+        )
 
     def to_dict(self) -> Dict:
         changes: List[Dict] = [change.to_dict() for change in self.changes]
-
-        return {
-            "medication_id": self.medication_id,
-            "dose_amount": self.dose_amount,
-            "routine_sct_code": self.routine_sct_code,
-            "changes": [] if changes is None else changes,
-            **self.pack_identifier(),
-        }
+        return self.to_dict_no_relations(changes=changes)
 
     @classmethod
     def convert_response_to_dict(cls, response: QueryResponse, method: str) -> Dict:
@@ -187,6 +167,7 @@ class DoseChange(NeomodelIdentifier, StructuredNode):
         return cls(*args, **kwargs)
 
     @classmethod
+    @cache
     def schema(cls) -> Dict:
         return {
             "optional": {
@@ -198,29 +179,14 @@ class DoseChange(NeomodelIdentifier, StructuredNode):
             "updatable": {},
         }
 
-    @property
-    def created_by(self) -> str:
-        return self.created_by_
-
-    @created_by.setter
-    def created_by(self, v: str) -> None:
-        self.created_by_ = v
-
-    @property
-    def modified_by(self) -> str:
-        return self.modified_by_
-
-    @modified_by.setter
-    def modified_by(self, v: str) -> None:
-        self.modified_by_ = v
-
     def to_dict(self) -> Dict[str, Any]:
-        return {
-            "medication_id": self.medication_id,
-            "dose_amount": self.dose_amount,
-            "routine_sct_code": self.routine_sct_code,
-            **self.pack_identifier(),
-        }
+        return self.pack_identifier(
+            {
+                "medication_id": self.medication_id,
+                "dose_amount": self.dose_amount,
+                "routine_sct_code": self.routine_sct_code,
+            }
+        )
 
     to_dict_no_relations = to_dict
 
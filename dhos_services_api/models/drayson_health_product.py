@@ -1,25 +1,26 @@
-from datetime import datetime
+from datetime import date
 from enum import Enum
-from typing import Any, Dict, Optional, Union
+from functools import cache
+from typing import Any, Dict, Optional
 
 import lazy_import
 from flask import abort
 from flask_batteries_included.helpers import schema
-from flask_batteries_included.helpers.timestamp import (
-    parse_date_to_iso8601,
-    parse_iso8601_to_date,
-)
 from neomodel import (
     BooleanProperty,
-    DateProperty,
     RelationshipDefinition,
     RelationshipTo,
     StringProperty,
     StructuredNode,
 )
 
-from dhos_services_api.helpers.responses import QueryResponse, response_to_dict
-from dhos_services_api.neodb import NeomodelIdentifier, db
+from dhos_services_api.helpers.dates import parse_date_to_iso8601, parse_iso8601_to_date
+from dhos_services_api.helpers.responses import (
+    QueryResponse,
+    by_created,
+    response_to_dict,
+)
+from dhos_services_api.neodb import IsoDateProperty, NeomodelIdentifier, db
 
 clinician_module = lazy_import.lazy_module(
     "dhos_services_api.models.clinician", level="leaf"
@@ -39,15 +40,11 @@ class DraysonHealthProductChangeEvent(Enum):
 
 class BaseProduct(NeomodelIdentifier):
     product_name = StringProperty()
-    opened_date_ = DateProperty(default=datetime.now().date, db_property="opened_date")
-    closed_date_ = DateProperty(default=None, db_property="closed_date")
+    opened_date_ = IsoDateProperty(default=date.today, db_property="opened_date")
+    closed_date_ = IsoDateProperty(default=None, db_property="closed_date")
 
     @property
     def opened_date(self) -> Optional[str]:
-
-        if self.opened_date_ is None:
-            return None
-
         return parse_date_to_iso8601(self.opened_date_)
 
     @opened_date.setter
@@ -60,9 +57,6 @@ class BaseProduct(NeomodelIdentifier):
 
     @property
     def closed_date(self) -> Optional[Any]:
-
-        if self.closed_date_ is None:
-            return None
         return parse_date_to_iso8601(self.closed_date_)
 
     @closed_date.setter
@@ -72,40 +66,23 @@ class BaseProduct(NeomodelIdentifier):
             return
         self.closed_date_ = parse_iso8601_to_date(value)
 
-    @property
-    def created_by(self) -> str:
-        return self.created_by_
-
-    @created_by.setter
-    def created_by(self, v: str) -> None:
-        self.created_by_ = v
-
-    @property
-    def modified_by(self) -> str:
-        return self.modified_by_
-
-    @modified_by.setter
-    def modified_by(self, v: str) -> None:
-        self.modified_by_ = v
-
-    def pack_base_product(self) -> Union[Dict[str, Optional[str]], Dict[str, str]]:
-
-        return {
-            "product_name": self.product_name,
-            "opened_date": self.opened_date,
-            "closed_date": self.closed_date,
-            **self.pack_identifier(),
-        }
+    def pack_base_product(self, result: Optional[Dict] = None) -> Dict:
+        if result is None:
+            result = {}
+        result["product_name"] = self.product_name
+        result["opened_date"] = self.opened_date
+        result["closed_date"] = self.closed_date
+        return self.pack_identifier(result)
 
 
 class DraysonHealthProduct(BaseProduct, StructuredNode):
 
     accessibility_discussed = BooleanProperty(default=False)
     accessibility_discussed_with = StringProperty()
-    accessibility_discussed_date_ = DateProperty()
+    accessibility_discussed_date_ = IsoDateProperty()
 
-    opened_date_ = DateProperty(default=datetime.now().date, db_property="opened_date")
-    closed_date_ = DateProperty(default=None, db_property="closed_date")
+    opened_date_ = IsoDateProperty(default=date.today, db_property="opened_date")
+    closed_date_ = IsoDateProperty(default=None, db_property="closed_date")
     closed_reason = StringProperty()
     closed_reason_other = StringProperty()
 
@@ -116,10 +93,6 @@ class DraysonHealthProduct(BaseProduct, StructuredNode):
 
     @property
     def opened_date(self) -> Optional[str]:
-
-        if self.opened_date_ is None:
-            return None
-
         return parse_date_to_iso8601(self.opened_date_)
 
     @opened_date.setter
@@ -132,10 +105,6 @@ class DraysonHealthProduct(BaseProduct, StructuredNode):
 
     @property
     def closed_date(self) -> Optional[str]:
-
-        if self.closed_date_ is None:
-            return None
-
         return parse_date_to_iso8601(self.closed_date_)
 
     @closed_date.setter
@@ -146,28 +115,8 @@ class DraysonHealthProduct(BaseProduct, StructuredNode):
 
         self.closed_date_ = parse_iso8601_to_date(value)
 
-    @property
-    def created_by(self) -> str:
-        return self.created_by_
-
-    @created_by.setter
-    def created_by(self, v: str) -> None:
-        self.created_by_ = v
-
-    @property
-    def modified_by(self) -> str:
-        return self.modified_by_
-
-    @modified_by.setter
-    def modified_by(self, v: str) -> None:
-        self.modified_by_ = v
-
     @property
     def accessibility_discussed_date(self) -> Optional[str]:
-
-        if self.accessibility_discussed_date_ is None:
-            return None
-
         return parse_date_to_iso8601(self.accessibility_discussed_date_)
 
     @accessibility_discussed_date.setter
@@ -184,6 +133,7 @@ class DraysonHealthProduct(BaseProduct, StructuredNode):
         return cls(*args, **kwargs)
 
     @classmethod
+    @cache
     def schema(cls) -> Dict[str, Dict[str, type]]:
         return {
             "optional": {
@@ -261,15 +211,13 @@ class DraysonHealthProduct(BaseProduct, StructuredNode):
         self._new_event(event=DraysonHealthProductChangeEvent.START_MONITORING)
 
     def to_dict_no_relations(self, clinician: Dict = None) -> Dict:
-        resp = {
-            "product_name": self.product_name,
-            "opened_date": self.opened_date,
-            "closed_date": self.closed_date,
-            "closed_reason": self.closed_reason,
-            "closed_reason_other": self.closed_reason_other,
-            "monitored_by_clinician": self.monitored_by_clinician,
-            **self.pack_base_product(),
-        }
+        resp = self.pack_base_product(
+            {
+                "closed_reason": self.closed_reason,
+                "closed_reason_other": self.closed_reason_other,
+                "monitored_by_clinician": self.monitored_by_clinician,
+            }
+        )
 
         if self.accessibility_discussed:
             resp["accessibility_discussed"] = self.accessibility_discussed
@@ -279,21 +227,16 @@ class DraysonHealthProduct(BaseProduct, StructuredNode):
         return resp
 
     def to_dict(self) -> Dict[str, Optional[str]]:
-        resp = {
-            "product_name": self.product_name,
-            "opened_date": self.opened_date,
-            "closed_date": self.closed_date,
-            "closed_reason": self.closed_reason,
-            "closed_reason_other": self.closed_reason_other,
-            "monitored_by_clinician": self.monitored_by_clinician,
-            "changes": list(
-                sorted(
-                    (change.to_dict() for change in self.changes),
-                    key=lambda x: x["created"],
-                )
-            ),
-            **self.pack_base_product(),
-        }
+        resp = self.pack_base_product(
+            {
+                "closed_reason": self.closed_reason,
+                "closed_reason_other": self.closed_reason_other,
+                "monitored_by_clinician": self.monitored_by_clinician,
+                "changes": sorted(
+                    [change.to_dict() for change in self.changes], key=by_created
+                ),
+            }
+        )
 
         if self.accessibility_discussed:
             resp["accessibility_discussed"] = self.accessibility_discussed
@@ -303,15 +246,16 @@ class DraysonHealthProduct(BaseProduct, StructuredNode):
         return resp
 
     def to_compact_dict(self) -> Dict[str, Optional[str]]:
-        return {
-            "product_name": self.product_name,
-            "opened_date": self.opened_date,
-            "closed_date": self.closed_date,
-            "closed_reason": self.closed_reason,
-            "closed_reason_other": self.closed_reason_other,
-            "monitored_by_clinician": self.monitored_by_clinician,
-            **self.compack_identifier(),
-        }
+        return self.compack_identifier(
+            {
+                "product_name": self.product_name,
+                "opened_date": self.opened_date,
+                "closed_date": self.closed_date,
+                "closed_reason": self.closed_reason,
+                "closed_reason_other": self.closed_reason_other,
+                "monitored_by_clinician": self.monitored_by_clinician,
+            }
+        )
 
     @classmethod
     def convert_response_to_dict(cls, response: QueryResponse, method: str) -> Dict:
@@ -327,6 +271,7 @@ class DraysonHealthProduct(BaseProduct, StructuredNode):
 
 class ClinicianProduct(BaseProduct, StructuredNode):
     @classmethod
+    @cache
     def schema(cls) -> Dict[str, Dict[str, type]]:
         return {
             "optional": {"closed_date": str},
@@ -335,7 +280,7 @@ class ClinicianProduct(BaseProduct, StructuredNode):
         }
 
     def to_dict(self) -> Dict[str, Optional[str]]:
-        return {**self.pack_base_product()}
+        return self.pack_base_product()
 
     @classmethod
     def new(cls, *args: Any, **kwargs: Any) -> "ClinicianProduct":
@@ -369,6 +314,7 @@ class ClinicianProduct(BaseProduct, StructuredNode):
 
 class LocationProduct(BaseProduct, StructuredNode):
     @classmethod
+    @cache
     def schema(cls) -> Dict[str, Dict[str, type]]:
         return {
             "optional": {"closed_date": str},
@@ -377,12 +323,13 @@ class LocationProduct(BaseProduct, StructuredNode):
         }
 
     def to_dict(self) -> Dict[str, Optional[str]]:
-        return {
-            "product_name": self.product_name,
-            "opened_date": self.opened_date,
-            "closed_date": self.closed_date,
-            **self.compack_identifier(),
-        }
+        return self.compack_identifier(
+            {
+                "product_name": self.product_name,
+                "opened_date": self.opened_date,
+                "closed_date": self.closed_date,
+            }
+        )
 
     @classmethod
     def new(cls, *args: Any, **kwargs: Any) -> "LocationProduct":
@@ -421,6 +368,7 @@ class DraysonHealthProductChange(NeomodelIdentifier, StructuredNode):
         return cls(*args, **kwargs)
 
     @classmethod
+    @cache
     def schema(cls) -> Dict:
         return {
             "optional": {},
@@ -428,27 +376,12 @@ class DraysonHealthProductChange(NeomodelIdentifier, StructuredNode):
             "updatable": {},
         }
 
-    @property
-    def created_by(self) -> str:
-        return self.created_by_
-
-    @created_by.setter
-    def created_by(self, v: str) -> None:
-        self.created_by_ = v
-
-    @property
-    def modified_by(self) -> str:
-        return self.modified_by_
-
-    @modified_by.setter
-    def modified_by(self, v: str) -> None:
-        self.modified_by_ = v
-
     def to_dict(self) -> Dict[str, Any]:
-        return {
-            "event": self.event,
-            **self.pack_identifier(),
-        }
+        return self.pack_identifier(
+            {
+                "event": self.event,
+            }
+        )
 
     to_dict_no_relations = to_dict
 
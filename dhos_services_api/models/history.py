@@ -1,3 +1,4 @@
+from functools import cache
 from typing import Any, Dict, List
 
 from flask_batteries_included.helpers import schema
@@ -18,6 +19,7 @@ class History(NeomodelIdentifier, StructuredNode):
         return cls(*args, **kwargs)
 
     @classmethod
+    @cache
     def schema(cls) -> Dict:
         return {
             "optional": {"parity": int, "gravidity": int},
@@ -26,11 +28,12 @@ class History(NeomodelIdentifier, StructuredNode):
         }
 
     def to_dict(self) -> Dict:
-        return {
-            "parity": self.parity,
-            "gravidity": self.gravidity,
-            **self.pack_identifier(),
-        }
+        return self.pack_identifier(
+            {
+                "parity": self.parity,
+                "gravidity": self.gravidity,
+            }
+        )
 
     to_dict_no_relations = to_dict
 
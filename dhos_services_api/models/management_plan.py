@@ -1,3 +1,4 @@
+from functools import cache
 from typing import Any, Dict, Iterable, List, Optional
 
 from flask_batteries_included.helpers import schema
@@ -66,6 +67,7 @@ class ManagementPlan(NeomodelIdentifier, PlanMixin, StructuredNode):
             self.save()
 
     @classmethod
+    @cache
     def schema(cls) -> Dict[str, Dict[str, Any]]:
         return {
             "optional": {
@@ -90,18 +92,19 @@ class ManagementPlan(NeomodelIdentifier, PlanMixin, StructuredNode):
         doses: Iterable[Dict] = None,
         dose_history: Iterable[Dict] = None,
     ) -> Dict:
-        return {
-            "start_date": self.start_date,
-            "end_date": self.end_date,
-            "sct_code": self.sct_code,
-            "actions": [] if actions is None else actions,
-            "doses": [] if doses is None else doses,
-            "plan_history": self.plan_history,
-            "dose_history": []
-            if dose_history is None
-            else sorted(dose_history, key=lambda x: x["modified"], reverse=True),
-            **self.pack_identifier(),
-        }
+        return self.pack_identifier(
+            {
+                "start_date": self.start_date,
+                "end_date": self.end_date,
+                "sct_code": self.sct_code,
+                "actions": [] if actions is None else actions,
+                "doses": [] if doses is None else doses,
+                "plan_history": self.plan_history,
+                "dose_history": []
+                if dose_history is None
+                else sorted(dose_history, key=lambda x: x["modified"], reverse=True),
+            }
+        )
 
     def to_dict(self) -> Dict[str, Any]:
         return self.to_dict_no_relations(
@@ -156,6 +159,7 @@ class DoseHistory(NeomodelIdentifier, StructuredNode):
         return obj
 
     @classmethod
+    @cache
     def schema(cls) -> Dict[str, Dict[str, Any]]:
         return {
             "optional": {
@@ -167,29 +171,14 @@ class DoseHistory(NeomodelIdentifier, StructuredNode):
             "updatable": {},
         }
 
-    @property
-    def created_by(self) -> str:
-        return self.created_by_
-
-    @created_by.setter
-    def created_by(self, v: str) -> None:
-        self.created_by_ = v
-
-    @property
-    def modified_by(self) -> str:
-        return self.modified_by_
-
-    @modified_by.setter
-    def modified_by(self, v: str) -> None:
-        self.modified_by_ = v
-
     def to_dict_no_relations(self, dose: Dict = None) -> Dict:
-        return {
-            "clinician_uuid": self.clinician_uuid,
-            "dose": dose,
-            "action": self.action,
-            **self.pack_identifier(),
-        }
+        return self.pack_identifier(
+            {
+                "clinician_uuid": self.clinician_uuid,
+                "dose": dose,
+                "action": self.action,
+            }
+        )
 
     def to_dict(self) -> Dict[str, Any]:
         return self.to_dict_no_relations(
@@ -1,7 +1,20 @@
+import operator
 from typing import Dict, Optional
 
 from neomodel import StringProperty
 
+_ADDRESS_FIELDS = (
+    "address_line_1",
+    "address_line_2",
+    "address_line_3",
+    "address_line_4",
+    "locality",
+    "region",
+    "postcode",
+    "country",
+)
+_get_address_fields = operator.attrgetter(*_ADDRESS_FIELDS)
+
 
 class AddressMixin:
 
@@ -15,14 +28,4 @@ class AddressMixin:
     country: Optional[str] = StringProperty()
 
     def pack_address(self) -> Dict[str, Optional[str]]:
-
-        return {
-            "address_line_1": self.address_line_1,
-            "address_line_2": self.address_line_2,
-            "address_line_3": self.address_line_3,
-            "address_line_4": self.address_line_4,
-            "locality": self.locality,
-            "region": self.region,
-            "postcode": self.postcode,
-            "country": self.country,
-        }
+        return dict(zip(_ADDRESS_FIELDS, _get_address_fields(self)))
@@ -1,16 +1,15 @@
 from typing import Optional
 
-from flask_batteries_included.helpers.timestamp import (
-    parse_date_to_iso8601,
-    parse_iso8601_to_date,
-)
-from neomodel import DateProperty, StringProperty
+from neomodel import StringProperty
+
+from dhos_services_api.helpers.dates import parse_date_to_iso8601, parse_iso8601_to_date
+from dhos_services_api.neodb import IsoDateProperty
 
 
 class PlanMixin:
 
-    start_date_ = DateProperty(db_property="start_date")
-    end_date_ = DateProperty(db_property="end_date")
+    start_date_ = IsoDateProperty(db_property="start_date")
+    end_date_ = IsoDateProperty(db_property="end_date")
 
     sct_code = (
         StringProperty()
@@ -18,8 +17,6 @@ class PlanMixin:
 
     @property
     def start_date(self) -> Optional[str]:
-        if self.start_date_ is None:
-            return None
         return parse_date_to_iso8601(self.start_date_)
 
     @start_date.setter
@@ -30,8 +27,6 @@ class PlanMixin:
 
     @property
     def end_date(self) -> Optional[str]:
-        if self.end_date_ is None:
-            return None
         return parse_date_to_iso8601(self.end_date_)
 
     @end_date.setter
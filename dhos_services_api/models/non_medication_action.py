@@ -1,3 +1,4 @@
+from functools import cache
 from typing import Any, Dict
 
 from flask_batteries_included.helpers import schema
@@ -19,6 +20,7 @@ class NonMedicationAction(NeomodelIdentifier, StructuredNode):
         return cls(*args, **kwargs)
 
     @classmethod
+    @cache
     def schema(cls) -> Dict[str, Dict[str, type]]:
         return {
             "optional": {},
@@ -27,7 +29,7 @@ class NonMedicationAction(NeomodelIdentifier, StructuredNode):
         }
 
     def to_dict(self) -> Dict[str, str]:
-        return {"action_sct_code": self.action_sct_code, **self.pack_identifier()}
+        return self.pack_identifier({"action_sct_code": self.action_sct_code})
 
     to_dict_no_relations = to_dict
 
@@ -1,3 +1,4 @@
+from functools import cache
 from typing import Any, Dict
 
 from flask_batteries_included.helpers import schema
@@ -19,6 +20,7 @@ class Note(NeomodelIdentifier, StructuredNode):
         return obj
 
     @classmethod
+    @cache
     def schema(cls) -> Dict[str, Dict[str, type]]:
         return {
             "optional": {},
@@ -26,19 +28,15 @@ class Note(NeomodelIdentifier, StructuredNode):
             "updatable": {"content": str, "clinician_uuid": str},
         }
 
-    def to_dict_no_relations(self) -> Dict:
-        return {
-            "content": self.content,
-            "clinician_uuid": self.clinician_uuid,
-            **self.pack_identifier(),
-        }
-
     def to_dict(self) -> Dict[str, Any]:
-        return {
-            "content": self.content,
-            "clinician_uuid": self.clinician_uuid,
-            **self.pack_identifier(),
-        }
+        return self.pack_identifier(
+            {
+                "content": self.content,
+                "clinician_uuid": self.clinician_uuid,
+            }
+        )
+
+    to_dict_no_relations = to_dict
 
     @classmethod
     def convert_response_to_dict(cls, response: QueryResponse, method: str) -> Dict:
@@ -1,25 +1,23 @@
+from functools import cache
 from typing import Any, Dict, Optional
 
 from flask_batteries_included.helpers import schema
-from flask_batteries_included.helpers.timestamp import (
-    parse_date_to_iso8601,
-    parse_iso8601_to_date,
-)
-from neomodel import DateProperty, JSONProperty, StringProperty, StructuredNode
+from neomodel import JSONProperty, StringProperty, StructuredNode
 
 # =SNOMED codes:
 #  - HbA1c level (1003671000000109)
 #  - Biological sex (429019009)
 #  - Highest education level ()
 #  - Glucose tolerance test (113076002)
+from dhos_services_api.helpers.dates import parse_date_to_iso8601, parse_iso8601_to_date
 from dhos_services_api.helpers.responses import QueryResponse, response_to_dict
-from dhos_services_api.neodb import NeomodelIdentifier
+from dhos_services_api.neodb import IsoDateProperty, NeomodelIdentifier
 
 
 class ObservableEntity(NeomodelIdentifier, StructuredNode):
 
     sct_code = StringProperty()
-    date_observed_ = DateProperty(db_property="date_observed")
+    date_observed_ = IsoDateProperty(db_property="date_observed")
     value_as_string = StringProperty()
     metadata = JSONProperty()
 
@@ -39,6 +37,7 @@ class ObservableEntity(NeomodelIdentifier, StructuredNode):
         return cls(*args, **kwargs)
 
     @classmethod
+    @cache
     def schema(cls) -> Dict[str, Dict[str, type]]:
         return {
             "optional": {"metadata": dict, "value_as_string": str},
@@ -52,13 +51,14 @@ class ObservableEntity(NeomodelIdentifier, StructuredNode):
         }
 
     def to_dict(self) -> Dict[str, Optional[str]]:
-        return {
-            "sct_code": self.sct_code,
-            "date_observed": self.date_observed,
-            "value_as_string": self.value_as_string,
-            "metadata": self.metadata,
-            **self.pack_identifier(),
-        }
+        return self.pack_identifier(
+            {
+                "sct_code": self.sct_code,
+                "date_observed": self.date_observed,
+                "value_as_string": self.value_as_string,
+                "metadata": self.metadata,
+            }
+        )
 
     to_dict_no_relations = to_dict
 
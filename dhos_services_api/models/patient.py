@@ -1,14 +1,10 @@
 import datetime
-from typing import Any, Dict, List, Optional, Union
+from functools import cache
+from typing import Any, Dict, List, Optional, Tuple, Union
 
-from flask_batteries_included.helpers.timestamp import (
-    parse_date_to_iso8601,
-    parse_iso8601_to_date,
-)
 from neomodel import (
     ArrayProperty,
     BooleanProperty,
-    DateProperty,
     IntegerProperty,
     One,
     RelationshipTo,
@@ -19,7 +15,8 @@ from neomodel import (
 )
 
 import dhos_services_api.models.record
-from dhos_services_api.helpers.neo_utils import get_node_or_404
+from dhos_services_api.helpers.dates import parse_date_to_iso8601, parse_iso8601_to_date
+from dhos_services_api.helpers.neo_utils import create_related_nodes, get_node_or_404
 from dhos_services_api.helpers.responses import (
     QueryResponse,
     response_to_dict,
@@ -30,10 +27,63 @@ from dhos_services_api.models.mixins.user import UserMixin
 from dhos_services_api.models.personal_address import PersonalAddress
 from dhos_services_api.models.record import Record
 from dhos_services_api.models.terms_agreement import TermsAgreement
-from dhos_services_api.neodb import NeomodelIdentifier
+from dhos_services_api.neodb import (
+    IsoDateProperty,
+    NeomodelIdentifier,
+    db,
+    register_warmup_query,
+)
 
+MINIMUM_GDM_AGE_IN_YEARS = 16
 _MARKER: Any = object()
 
+# SNOMED codes for "other" answers which have an accompanying free text field
+EDUCATION_LEVEL_OTHER = "365460000"
+ETHNICITY_OTHER = "186023009"
+ACCESSIBILITY_CONSIDERATION_OTHER = "D0000032"
+
+# (field, "other" code, free-text field, default) - the free-text field is cleared
+# unless the field selects the "other" code. Where a default is given, the free-text
+# value is applied (or defaulted) when "other" is selected.
+_OTHER_FIELDS: Tuple[Tuple[str, str, str, Optional[str]], ...] = (
+    (
+        "highest_education_level",
+        EDUCATION_LEVEL_OTHER,
+        "highest_education_level_other",
+        None,
+    ),
+    ("ethnicity", ETHNICITY_OTHER, "ethnicity_other", ""),
+    (
+        "accessibility_considerations",
+        ACCESSIBILITY_CONSIDERATION_OTHER,
+        "accessibility_considerations_other",
+        None,
+    ),
+)
+
+# Fetches all of the patient's directly related nodes in a single round-trip.
+_PATIENT_RELATIONS_QUERY = register_warmup_query(
+    """
+MATCH (p:Patient {uuid:$uuid})
+OPTIONAL MATCH (p)-[:HAS_RECORD]->(r:Record)
+OPTIONAL MATCH (p)-[:HAS_PERSONAL_ADDRESS]->(a:PersonalAddress)
+WITH p, r, collect(a) AS personal_addresses
+OPTIONAL MATCH (p)-[:ACTIVE_ON_PRODUCT]->(d:DraysonHealthProduct)
+WITH p, r, personal_addresses, collect(d) AS dh_products
+OPTIONAL MATCH (p)-[:HAS_ACCEPTED]->(t:TermsAgreement)
+RETURN r, personal_addresses, dh_products, collect(t) AS terms_agreement
+"""
+)
+
+_PATIENT_COMPACT_RELATIONS_QUERY = register_warmup_query(
+    """
+MATCH (p:Patient {uuid:$uuid})
+OPTIONAL MATCH (p)-[:HAS_RECORD]->(r:Record)
+OPTIONAL MATCH (p)-[:ACTIVE_ON_PRODUCT]->(d:DraysonHealthProduct)
+RETURN r, collect(d) AS dh_products
+"""
+)
+
 
 def _latest_terms_agreement(terms_aggreements: List[TermsAgreement]) -> Optional[Dict]:
     if not terms_aggreements:
@@ -51,22 +101,28 @@ def _latest_terms_agreement(terms_aggreements: List[TermsAgreement]) -> Optional
     return sorted_terms[0].to_dict()
 
 
+def _years_before(date: datetime.date, years: int) -> datetime.date:
+    try:
+        return date.replace(year=date.year - years)
+    except ValueError:
+        # 29th February, and the earlier year is not a leap year
+        return date.replace(year=date.year - years, day=28)
+
+
 def merge_schemas(
     x: Dict[str, Dict[str, Any]], y: Dict[str, Dict[str, Any]]
 ) -> Dict[str, Dict[str, Any]]:
-
-    merged = x.copy()
-    merged["optional"].update(y["optional"])
-    merged["required"].update(y["required"])
-    merged["updatable"].update(y["updatable"])
-
-    return merged
+    return {
+        "optional": x["optional"] | y["optional"],
+        "required": x["required"] | y["required"],
+        "updatable": x["updatable"] | y["updatable"],
+    }
 
 
 class Patient(NeomodelIdentifier, UserMixin, StructuredNode):
     # Identity
-    dob_ = DateProperty(db_property="dob")
-    dod_ = DateProperty(db_property="dod")
+    dob_ = IsoDateProperty(db_property="dob")
+    dod_ = IsoDateProperty(db_property="dod")
 
     nhs_number = StringProperty()
     hospital_number = StringProperty()
@@ -117,6 +173,7 @@ class Patient(NeomodelIdentifier, UserMixin, StructuredNode):
     fhir_resource_id = StringProperty()
 
     @classmethod
+    @cache
     def patient_validate_schema(cls) -> Dict:
         # ** This is used by the /patient/validate endpoint **
         # TODO this probably needs a better place to live...
@@ -132,6 +189,7 @@ class Patient(NeomodelIdentifier, UserMixin, StructuredNode):
         }
 
     @classmethod
+    @cache
     def shared_schema(cls) -> Dict[str, Dict[str, Any]]:
         return {
             "optional": {
@@ -183,6 +241,7 @@ class Patient(NeomodelIdentifier, UserMixin, StructuredNode):
         }
 
     @classmethod
+    @cache
     def gdm_exclusive_schema(cls) -> Dict[str, Dict[str, Any]]:
         return {
             "optional": {"dod": str, "fhir_resource_id": str},
@@ -199,10 +258,12 @@ class Patient(NeomodelIdentifier, UserMixin, StructuredNode):
         }
 
     @classmethod
+    @cache
     def gdm_schema(cls) -> Dict[str, Dict[str, Any]]:
         return merge_schemas(cls.shared_schema(), cls.gdm_exclusive_schema())
 
     @classmethod
+    @cache
     def send_dod_exclusive_schema(cls) -> Dict[str, Dict[str, Any]]:
         return {
             "optional": {
@@ -213,10 +274,12 @@ class Patient(NeomodelIdentifier, UserMixin, StructuredNode):
         }
 
     @classmethod
+    @cache
     def send_dod_schema(cls) -> Dict[str, Dict[str, Any]]:
         return merge_schemas(cls.send_schema(), cls.send_dod_exclusive_schema())
 
     @classmethod
+    @cache
     def send_exclusive_schema(cls) -> Dict[str, Dict[str, Any]]:
         return {
             "optional": {
@@ -235,6 +298,7 @@ class Patient(NeomodelIdentifier, UserMixin, StructuredNode):
         }
 
     @classmethod
+    @cache
     def send_schema(cls) -> Dict[str, Dict[str, Any]]:
         return merge_schemas(cls.shared_schema(), cls.send_exclusive_schema())
 
@@ -254,20 +318,22 @@ class Patient(NeomodelIdentifier, UserMixin, StructuredNode):
             PersonalAddress.new(**addr) for addr in kwargs.pop("personal_addresses", [])
         ]
 
-        record = dhos_services_api.models.record.Record.new(**kwargs.pop("record", {}))
-
         dob = kwargs.get("dob", None)
 
         if dob:
             dob_dt = parse_iso8601_to_date(dob)
-            on_gdm = len(list(filter(lambda x: x.product_name == "GDM", products))) > 0
+            on_gdm = any(product.product_name == "GDM" for product in products)
             if dob_dt is None or (
                 on_gdm
-                and datetime.date.today() - datetime.timedelta(days=365.25 * 16)
+                and _years_before(datetime.date.today(), MINIMUM_GDM_AGE_IN_YEARS)
                 < dob_dt
             ):
                 raise ValueError("patient must be over 16 years old")
 
+        # Only create the record once the patient is known to be valid, as it is
+        # saved immediately.
+        record = dhos_services_api.models.record.Record.new(**kwargs.pop("record", {}))
+
         child_of = kwargs.pop("child_of", None)
 
         obj = cls(*args, **kwargs)
@@ -276,15 +342,9 @@ class Patient(NeomodelIdentifier, UserMixin, StructuredNode):
         # connect record to patient
         obj.record.connect(record)
 
-        # connect dh products to patient
-        for product in products:
-            product.save()
-            obj.dh_products.connect(product)
-
-        # connect personal addresses to patient
-        for address in personal_addresses:
-            address.save()
-            obj.personal_addresses.connect(address)
+        # save and connect dh products and personal addresses to patient
+        create_related_nodes(obj, "dh_products", products)
+        create_related_nodes(obj, "personal_addresses", personal_addresses)
 
         if child_of:
             parent_patient = get_node_or_404(Patient, uuid=child_of)
@@ -299,19 +359,17 @@ class Patient(NeomodelIdentifier, UserMixin, StructuredNode):
 
         super(Patient, self).on_patch(_json, **kwargs)
 
-        if _json.get("highest_education_level", None) != "365460000":
-            _json.pop("highest_education_level_other", None)
-            self.highest_education_level_other = None
-
-        if _json.get("ethnicity", None) != "186023009":
-            _json.pop("ethnicity_other", None)
-            self.ethnicity_other = None
-        else:
-            self.ethnicity_other = _json.pop("ethnicity_other", "")
-
-        if "D0000032" not in _json.get("accessibility_considerations", []):
-            _json.pop("accessibility_considerations_other", None)
-            self.accessibility_considerations_other = None
+        for field, other_code, other_field, default_other in _OTHER_FIELDS:
+            value = _json.get(field)
+            if isinstance(value, list):
+                selected = other_code in value
+            else:
+                selected = value == other_code
+            if not selected:
+                _json.pop(other_field, None)
+                setattr(self, other_field, None)
+            elif default_other is not None:
+                setattr(self, other_field, _json.pop(other_field, default_other))
 
     @property
     def dob(self) -> Optional[str]:
@@ -331,18 +389,15 @@ class Patient(NeomodelIdentifier, UserMixin, StructuredNode):
 
     @property
     def bookmarked(self) -> bool:
-        return len(self.bookmarked_at_locations) > 0
+        return bool(self.bookmarked_at_locations)
 
     # 'active_only=True' returns True if patient is active on product
     def has_product(self, product_name: str, active_only: bool = False) -> bool:
-        for product in self.dh_products:
-            if product.product_name == product_name:
-                if active_only:
-                    if product.closed_date is None:
-                        return True
-                else:
-                    return True
-        return False
+        return any(
+            product.product_name == product_name
+            and (not active_only or product.closed_date is None)
+            for product in self.dh_products
+        )
 
     def to_dict_no_relations(
         self,
@@ -350,71 +405,59 @@ class Patient(NeomodelIdentifier, UserMixin, StructuredNode):
         record: Dict = None,
         dh_products: List[Dict] = None,
         bookmarked: bool = None,
-        terms_agreement: List[Dict] = None,
+        terms_agreement: Dict = None,
     ) -> Dict:
 
-        result: Dict = {
-            "allowed_to_text": self.allowed_to_text,
-            "allowed_to_email": self.allowed_to_email,
-            "dob": self.dob,
-            "dod": self.dod,
-            "nhs_number": self.nhs_number,
-            "hospital_number": self.hospital_number,
-            "email_address": self.email_address,
-            "personal_addresses": personal_addresses,
-            "ethnicity": self.ethnicity,
-            "ethnicity_other": self.ethnicity_other,
-            "sex": self.sex,
-            "height_in_mm": self.height_in_mm,
-            "weight_in_g": self.weight_in_g,
-            "highest_education_level": self.highest_education_level,
-            "highest_education_level_other": self.highest_education_level_other,
-            "accessibility_considerations": self.accessibility_considerations,
-            "accessibility_considerations_other": self.accessibility_considerations_other,
-            "other_notes": self.other_notes,
-            "record": record,
-            "locations": self.locations,
-            "bookmarked": bookmarked,
-            "has_been_bookmarked": self.has_been_bookmarked,
-            "dh_products": dh_products,
-            "terms_agreement": terms_agreement,
-            "fhir_resource_id": self.fhir_resource_id,
-            **self.pack_user(),
-            **self.pack_identifier(),
-        }
-        return result
+        return self.pack_identifier(
+            {
+                "allowed_to_text": self.allowed_to_text,
+                "allowed_to_email": self.allowed_to_email,
+                "dob": self.dob,
+                "dod": self.dod,
+                "nhs_number": self.nhs_number,
+                "hospital_number": self.hospital_number,
+                "email_address": self.email_address,
+                "personal_addresses": personal_addresses,
+                "ethnicity": self.ethnicity,
+                "ethnicity_other": self.ethnicity_other,
+                "sex": self.sex,
+                "height_in_mm": self.height_in_mm,
+                "weight_in_g": self.weight_in_g,
+                "highest_education_level": self.highest_education_level,
+                "highest_education_level_other": self.highest_education_level_other,
+                "accessibility_considerations": self.accessibility_considerations,
+                "accessibility_considerations_other": self.accessibility_considerations_other,
+                "other_notes": self.other_notes,
+                "record": record,
+                "locations": self.locations,
+                "bookmarked": bookmarked,
+                "has_been_bookmarked": self.has_been_bookmarked,
+                "dh_products": dh_products,
+                "terms_agreement": terms_agreement,
+                "fhir_resource_id": self.fhir_resource_id,
+                "first_name": self.first_name,
+                "last_name": self.last_name,
+                "phone_number": self.phone_number,
+            }
+        )
 
     def to_dict(self) -> Dict[str, Any]:
-
-        return {
-            "allowed_to_text": self.allowed_to_text,
-            "allowed_to_email": self.allowed_to_email,
-            "dob": self.dob,
-            "dod": self.dod,
-            "nhs_number": self.nhs_number,
-            "hospital_number": self.hospital_number,
-            "email_address": self.email_address,
-            "personal_addresses": [addr.to_dict() for addr in self.personal_addresses],
-            "ethnicity": self.ethnicity,
-            "ethnicity_other": self.ethnicity_other,
-            "sex": self.sex,
-            "height_in_mm": self.height_in_mm,
-            "weight_in_g": self.weight_in_g,
-            "highest_education_level": self.highest_education_level,
-            "highest_education_level_other": self.highest_education_level_other,
-            "accessibility_considerations": self.accessibility_considerations,
-            "accessibility_considerations_other": self.accessibility_considerations_other,
-            "other_notes": self.other_notes,
-            "record": self.record.single().to_dict(),
-            "locations": self.locations,
-            "bookmarked": bool(self.bookmarked),
-            "has_been_bookmarked": self.has_been_bookmarked,
-            "dh_products": [prod.to_dict() for prod in self.dh_products],
-            "terms_agreement": _latest_terms_agreement(self.terms_agreement.all()),
-            "fhir_resource_id": self.fhir_resource_id,
-            **self.pack_user(),
-            **self.pack_identifier(),
-        }
+        results, meta = db.cypher_query(_PATIENT_RELATIONS_QUERY, {"uuid": self.uuid})
+        record, addresses, products, terms_agreements = results[0]
+
+        return self.to_dict_no_relations(
+            personal_addresses=[
+                PersonalAddress.inflate(addr).to_dict() for addr in addresses
+            ],
+            record=Record.inflate(record).to_dict() if record is not None else None,
+            dh_products=[
+                DraysonHealthProduct.inflate(prod).to_dict() for prod in products
+            ],
+            bookmarked=self.bookmarked,
+            terms_agreement=_latest_terms_agreement(
+                [TermsAgreement.inflate(terms) for terms in terms_agreements]
+            ),
+        )
 
     def to_compact_dict(
         self,
@@ -424,28 +467,42 @@ class Patient(NeomodelIdentifier, UserMixin, StructuredNode):
         bookmarked: Optional[bool] = _MARKER,
         terms_agreement: List[Dict] = None,
     ) -> Dict:
-        if dh_products is _MARKER:
-            dh_products = [prod.to_compact_dict() for prod in self.dh_products]
+        if record is _MARKER or dh_products is _MARKER:
+            # Fetch whichever relations weren't passed in with a single query.
+            results, meta = db.cypher_query(
+                _PATIENT_COMPACT_RELATIONS_QUERY, {"uuid": self.uuid}
+            )
+            record_node, product_nodes = results[0]
+            if record is _MARKER:
+                record = (
+                    Record.inflate(record_node).to_compact_dict()
+                    if record_node is not None
+                    else None
+                )
+            if dh_products is _MARKER:
+                dh_products = [
+                    DraysonHealthProduct.inflate(prod).to_compact_dict()
+                    for prod in product_nodes
+                ]
 
         if bookmarked is _MARKER:
-            bookmarked = bool(self.bookmarked)
-
-        if record is _MARKER:
-            record = self.record.single().to_compact_dict()
-
-        return {
-            "dob": self.dob,
-            "nhs_number": self.nhs_number,
-            "hospital_number": self.hospital_number,
-            "sex": self.sex,
-            "record": record,
-            "bookmarked": bookmarked,
-            "dh_products": dh_products,
-            "locations": self.locations,
-            "fhir_resource_id": self.fhir_resource_id,
-            **self.compack_user(),
-            **self.compack_identifier(),
-        }
+            bookmarked = self.bookmarked
+
+        return self.compack_identifier(
+            {
+                "dob": self.dob,
+                "nhs_number": self.nhs_number,
+                "hospital_number": self.hospital_number,
+                "sex": self.sex,
+                "record": record,
+                "bookmarked": bookmarked,
+                "dh_products": dh_products,
+                "locations": self.locations,
+                "fhir_resource_id": self.fhir_resource_id,
+                "first_name": self.first_name,
+                "last_name": self.last_name,
+            }
+        )
 
     @classmethod
     def convert_response_to_dict(cls, response: QueryResponse, method: str) -> Dict:
@@ -477,6 +534,7 @@ class Patient(NeomodelIdentifier, UserMixin, StructuredNode):
 
 class Baby(Patient):
     @classmethod
+    @cache
     def gdm_schema(cls) -> Dict:
         return {
             "optional": {
@@ -529,8 +587,14 @@ class Baby(Patient):
         return {
             "sex": self.sex,
             "dob": self.dob,
-            **self.pack_user(),
-            **self.pack_identifier(),
+            "first_name": self.first_name,
+            "last_name": self.last_name,
+            "phone_number": self.phone_number,
+            "uuid": self.uuid,
+            "created": self.created,
+            "created_by": self.created_by,
+            "modified": self.modified,
+            "modified_by": self.modified_by,
         }
 
     def to_dict_no_relations(
@@ -539,7 +603,7 @@ class Baby(Patient):
         record: Dict = None,
         dh_products: List[Dict] = None,
         bookmarked: bool = None,
-        terms_agreement: List[Dict] = None,
+        terms_agreement: Dict = None,
     ) -> Dict:
         return self.to_dict()
 
@@ -551,7 +615,7 @@ class Baby(Patient):
         bookmarked: Optional[bool] = _MARKER,
         terms_agreement: List[Dict] = None,
     ) -> Dict:
-        return {"dob": self.dob, **self.compack_identifier()}
+        return {"dob": self.dob, "created": self.created, "uuid": self.uuid}
 
     @classmethod
     def convert_response_to_dict(cls, response: QueryResponse, method: str) -> Dict:
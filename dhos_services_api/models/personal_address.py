@@ -1,21 +1,19 @@
+from functools import cache
 from typing import Any, Dict, Optional, Union
 
 from flask_batteries_included.helpers import schema
-from flask_batteries_included.helpers.timestamp import (
-    parse_date_to_iso8601,
-    parse_iso8601_to_date,
-)
-from neomodel import DateProperty, StructuredNode
+from neomodel import StructuredNode
 
+from dhos_services_api.helpers.dates import parse_date_to_iso8601, parse_iso8601_to_date
 from dhos_services_api.helpers.responses import QueryResponse, response_to_dict
 from dhos_services_api.models.mixins.address import AddressMixin
-from dhos_services_api.neodb import NeomodelIdentifier
+from dhos_services_api.neodb import IsoDateProperty, NeomodelIdentifier
 
 
 class PersonalAddress(NeomodelIdentifier, AddressMixin, StructuredNode):
 
-    lived_from_ = DateProperty(db_property="lived_from")
-    lived_until_ = DateProperty(db_property="lived_until")
+    lived_from_ = IsoDateProperty(db_property="lived_from")
+    lived_until_ = IsoDateProperty(db_property="lived_until")
 
     @property
     def lived_from(self) -> Optional[str]:
@@ -39,6 +37,7 @@ class PersonalAddress(NeomodelIdentifier, AddressMixin, StructuredNode):
         return cls(*args, **kwargs)
 
     @classmethod
+    @cache
     def schema(cls) -> Dict[str, Dict[str, type]]:
         return {
             "optional": {
@@ -69,12 +68,13 @@ class PersonalAddress(NeomodelIdentifier, AddressMixin, StructuredNode):
         }
 
     def to_dict(self) -> Union[Dict[str, Optional[str]], Dict[str, str]]:
-        return {
-            "lived_from": self.lived_from,
-            "lived_until": self.lived_until,
-            **self.pack_address(),
-            **self.pack_identifier(),
-        }
+        return self.pack_identifier(
+            {
+                "lived_from": self.lived_from,
+                "lived_until": self.lived_until,
+                **self.pack_address(),
+            }
+        )
 
     to_dict_no_relations = to_dict
 
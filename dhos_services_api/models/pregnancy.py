@@ -1,15 +1,11 @@
-from datetime import datetime, timedelta
+from datetime import date, timedelta
+from functools import cache
 from typing import Any, Dict, Iterable, List, Optional
 
 from flask_batteries_included.helpers import schema
-from flask_batteries_included.helpers.timestamp import (
-    parse_date_to_iso8601,
-    parse_iso8601_to_date,
-)
 from neomodel import (
     ArrayProperty,
     BooleanProperty,
-    DateProperty,
     IntegerProperty,
     RelationshipTo,
     StringProperty,
@@ -17,16 +13,23 @@ from neomodel import (
 )
 
 import dhos_services_api.models.delivery
-from dhos_services_api.helpers.responses import QueryResponse, response_to_dict
-from dhos_services_api.neodb import NeomodelIdentifier
+from dhos_services_api.helpers.dates import parse_date_to_iso8601, parse_iso8601_to_date
+from dhos_services_api.helpers.neo_utils import connect_nodes
+from dhos_services_api.helpers.responses import (
+    QueryResponse,
+    by_created,
+    response_to_dict,
+)
+from dhos_services_api.neodb import IsoDateProperty, NeomodelIdentifier
 
 MAX_RETROACTIVE_EDD_PERIOD_IN_DAYS = 21
+_MAX_RETROACTIVE_EDD_PERIOD = timedelta(days=MAX_RETROACTIVE_EDD_PERIOD_IN_DAYS)
 _MARKER: Any = object()
 
 
 class Pregnancy(NeomodelIdentifier, StructuredNode):
 
-    estimated_delivery_date_ = DateProperty(db_property="estimated_delivery_date")
+    estimated_delivery_date_ = IsoDateProperty(db_property="estimated_delivery_date")
     planned_delivery_place = StringProperty()
     length_of_postnatal_stay_in_days = IntegerProperty()
     colostrum_harvesting = BooleanProperty()
@@ -47,7 +50,7 @@ class Pregnancy(NeomodelIdentifier, StructuredNode):
     delivery_place_other = StringProperty()
 
     first_medication_taken = StringProperty()
-    first_medication_taken_recorded_ = DateProperty(
+    first_medication_taken_recorded_ = IsoDateProperty(
         db_property="first_medication_taken_recorded"
     )
 
@@ -72,8 +75,7 @@ class Pregnancy(NeomodelIdentifier, StructuredNode):
     @classmethod
     def new(cls, *args: Any, **kwargs: Any) -> "Pregnancy":
 
-        validation_date = timedelta(days=MAX_RETROACTIVE_EDD_PERIOD_IN_DAYS)
-        earliest_allowed_edd = datetime.date(datetime.now() - validation_date)
+        earliest_allowed_edd = date.today() - _MAX_RETROACTIVE_EDD_PERIOD
         edd = parse_iso8601_to_date(kwargs.get("estimated_delivery_date"))
 
         if edd is None or earliest_allowed_edd > edd:
@@ -88,13 +90,13 @@ class Pregnancy(NeomodelIdentifier, StructuredNode):
         obj = cls(*args, **kwargs)
         obj.save()
 
-        for delivery in deliveries:
-            delivery.save()
-            obj.deliveries.connect(delivery)
+        # Delivery.new() has already saved the deliveries
+        connect_nodes(obj, "deliveries", deliveries)
 
         return obj
 
     @classmethod
+    @cache
     def schema(cls) -> Dict[str, Dict[str, Any]]:
         return {
             "optional": {
@@ -136,25 +138,26 @@ class Pregnancy(NeomodelIdentifier, StructuredNode):
         }
 
     def to_dict_no_relations(self, deliveries: Iterable[Dict] = ()) -> Dict:
-        return {
-            "estimated_delivery_date": self.estimated_delivery_date,
-            "planned_delivery_place": self.planned_delivery_place,
-            "length_of_postnatal_stay_in_days": self.length_of_postnatal_stay_in_days,
-            "colostrum_harvesting": self.colostrum_harvesting,
-            "expected_number_of_babies": self.expected_number_of_babies,
-            "pregnancy_complications": self.pregnancy_complications,
-            "induced": self.induced,
-            "deliveries": sorted(deliveries, key=lambda x: x["created"]),
-            "height_at_booking_in_mm": self.height_at_booking_in_mm,
-            "weight_at_diagnosis_in_g": self.weight_at_diagnosis_in_g,
-            "weight_at_booking_in_g": self.weight_at_booking_in_g,
-            "weight_at_36_weeks_in_g": self.weight_at_36_weeks_in_g,
-            "delivery_place": self.delivery_place,
-            "delivery_place_other": self.delivery_place_other,
-            "first_medication_taken_recorded": self.first_medication_taken_recorded,
-            "first_medication_taken": self.first_medication_taken,
-            **self.pack_identifier(),
-        }
+        return self.pack_identifier(
+            {
+                "estimated_delivery_date": self.estimated_delivery_date,
+                "planned_delivery_place": self.planned_delivery_place,
+                "length_of_postnatal_stay_in_days": self.length_of_postnatal_stay_in_days,
+                "colostrum_harvesting": self.colostrum_harvesting,
+                "expected_number_of_babies": self.expected_number_of_babies,
+                "pregnancy_complications": self.pregnancy_complications,
+                "induced": self.induced,
+                "deliveries": sorted(deliveries, key=by_created),
+                "height_at_booking_in_mm": self.height_at_booking_in_mm,
+                "weight_at_diagnosis_in_g": self.weight_at_diagnosis_in_g,
+                "weight_at_booking_in_g": self.weight_at_booking_in_g,
+                "weight_at_36_weeks_in_g": self.weight_at_36_weeks_in_g,
+                "delivery_place": self.delivery_place,
+                "delivery_place_other": self.delivery_place_other,
+                "first_medication_taken_recorded": self.first_medication_taken_recorded,
+                "first_medication_taken": self.first_medication_taken,
+            }
+        )
 
     def to_dict(self) -> Dict[str, Any]:
         return self.to_dict_no_relations(
@@ -165,14 +168,12 @@ class Pregnancy(NeomodelIdentifier, StructuredNode):
         if deliveries is _MARKER:
             deliveries = [delivery.to_compact_dict() for delivery in self.deliveries]
 
-        return {
-            "estimated_delivery_date": self.estimated_delivery_date,
-            "deliveries": sorted(
-                deliveries,
-                key=lambda x: x["created"],
-            ),
-            **self.compack_identifier(),
-        }
+        return self.compack_identifier(
+            {
+                "estimated_delivery_date": self.estimated_delivery_date,
+                "deliveries": sorted(deliveries, key=by_created),
+            }
+        )
 
     @classmethod
     def convert_response_to_dict(cls, response: QueryResponse, method: str) -> Dict:
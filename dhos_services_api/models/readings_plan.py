@@ -1,12 +1,20 @@
+from functools import cache
 from typing import Any, Dict, Iterable, Sequence
 
 from flask_batteries_included.helpers import schema
 from neomodel import IntegerProperty, RelationshipTo, StructuredNode
 
-from dhos_services_api.helpers.responses import QueryResponse, response_to_dict
+from dhos_services_api.helpers.neo_utils import create_related_nodes
+from dhos_services_api.helpers.responses import (
+    QueryResponse,
+    by_created,
+    response_to_dict,
+)
 from dhos_services_api.models.mixins.plan import PlanMixin
 from dhos_services_api.neodb import NeomodelIdentifier
 
+_CHANGE_FIELDS = ("days_per_week_to_take_readings", "readings_per_day")
+
 
 class ReadingsPlan(NeomodelIdentifier, PlanMixin, StructuredNode):
 
@@ -20,18 +28,18 @@ class ReadingsPlan(NeomodelIdentifier, PlanMixin, StructuredNode):
         schema.post(json_in=kwargs, **cls.schema())
 
         obj = cls(*args, **kwargs)
-        obj.save()
 
-        days_per_week_to_take_readings: int = kwargs["days_per_week_to_take_readings"]
-        readings_per_day: int = kwargs["readings_per_day"]
+        # The first change records the initial values, as on_patch() would with
+        # include_no_changes, but without saving the new plan a second time.
+        initial_values = {}
+        for field in _CHANGE_FIELDS:
+            value = getattr(obj, field)
+            if value is not None:
+                initial_values[field] = value
+        change = ReadingsPlanChange.new(**initial_values)
 
-        obj.on_patch(
-            {
-                "days_per_week_to_take_readings": days_per_week_to_take_readings,
-                "readings_per_day": readings_per_day,
-            },
-            include_no_changes=True,
-        )
+        obj.save()
+        create_related_nodes(obj, "changes", [change])
 
         return obj
 
@@ -46,40 +54,24 @@ class ReadingsPlan(NeomodelIdentifier, PlanMixin, StructuredNode):
         if _json is None:
             return
 
-        days_per_week_to_take_readings = _json.pop(
-            "days_per_week_to_take_readings", self.days_per_week_to_take_readings
-        )
-        if (
-            days_per_week_to_take_readings == self.days_per_week_to_take_readings
-            and not include_no_changes
-        ):
-            new_days_per_week_to_take_readings = None
-        else:
-            new_days_per_week_to_take_readings = days_per_week_to_take_readings
-
-        readings_per_day = _json.pop("readings_per_day", self.readings_per_day)
-        if readings_per_day == self.readings_per_day and not include_no_changes:
-            new_readings_per_day = None
-        else:
-            new_readings_per_day = readings_per_day
-
-        if new_days_per_week_to_take_readings is not None:
-            self.days_per_week_to_take_readings = new_days_per_week_to_take_readings
+        # Changes record only the fields that changed, unless include_no_changes is set.
+        changes = {}
+        for field in _CHANGE_FIELDS:
+            value = _json.pop(field, getattr(self, field))
+            if value is not None and (
+                include_no_changes or value != getattr(self, field)
+            ):
+                changes[field] = value
+                setattr(self, field, value)
 
-        if new_readings_per_day is not None:
-            self.readings_per_day = new_readings_per_day
-
-        node = ReadingsPlanChange.new()
-        node.days_per_week_to_take_readings = new_days_per_week_to_take_readings
-        node.readings_per_day = new_readings_per_day
-        node.save()
-
-        self.changes.connect(node)
+        node = ReadingsPlanChange.new(**changes)
+        create_related_nodes(self, "changes", [node])
 
         super(ReadingsPlan, self).on_patch()
         self.save()
 
     @classmethod
+    @cache
     def schema(cls) -> Dict[str, Dict[str, type]]:
         return {
             "optional": {
@@ -99,20 +91,21 @@ class ReadingsPlan(NeomodelIdentifier, PlanMixin, StructuredNode):
         }
 
     def to_dict_no_relations(self, changes: Iterable[Dict] = ()) -> Dict:
-        return {
-            "start_date": self.start_date,
-            "end_date": self.end_date,
-            "sct_code": self.sct_code,
-            "days_per_week_to_take_readings": self.days_per_week_to_take_readings,
-            "readings_per_day": self.readings_per_day,
-            "changes": sorted(changes, key=lambda x: x["created"]),
-            **self.pack_identifier(),
-        }
+        return self.pack_identifier(
+            {
+                "start_date": self.start_date,
+                "end_date": self.end_date,
+                "sct_code": self.sct_code,
+                "days_per_week_to_take_readings": self.days_per_week_to_take_readings,
+                "readings_per_day": self.readings_per_day,
+                "changes": sorted(changes, key=by_created),
+            }
+        )
 
     def to_dict(self) -> Dict[str, Any]:
         changes: Sequence[ReadingsPlanChange] = self.changes
         return self.to_dict_no_relations(
-            changes=(change.to_dict() for change in changes)
+            changes=[change.to_dict() for change in changes]
         )
 
     @classmethod
@@ -137,6 +130,7 @@ class ReadingsPlanChange(NeomodelIdentifier, StructuredNode):
         return cls(*args, **kwargs)
 
     @classmethod
+    @cache
     def schema(cls) -> Dict[str, Dict[str, type]]:
         return {
             "optional": {
@@ -147,28 +141,13 @@ class ReadingsPlanChange(NeomodelIdentifier, StructuredNode):
             "updatable": {},
         }
 
-    @property
-    def created_by(self) -> str:
-        return self.created_by_
-
-    @created_by.setter
-    def created_by(self, v: str) -> None:
-        self.created_by_ = v
-
-    @property
-    def modified_by(self) -> str:
-        return self.modified_by_
-
-    @modified_by.setter
-    def modified_by(self, v: str) -> None:
-        self.modified_by_ = v
-
     def to_dict(self) -> Dict:
-        return {
-            "days_per_week_to_take_readings": self.days_per_week_to_take_readings,
-            "readings_per_day": self.readings_per_day,
-            **self.pack_identifier(),
-        }
+        return self.pack_identifier(
+            {
+                "days_per_week_to_take_readings": self.days_per_week_to_take_readings,
+                "readings_per_day": self.readings_per_day,
+            }
+        )
 
     to_dict_no_relations = to_dict
 
@@ -1,18 +1,39 @@
+from functools import cache
 from typing import Any, Dict, Iterable, List
 
 from flask_batteries_included.helpers import schema
 from neomodel import One, RelationshipFrom, RelationshipTo, StructuredNode
 
-from dhos_services_api.helpers.responses import QueryResponse, response_to_dict
+from dhos_services_api.helpers.neo_utils import connect_nodes, create_related_nodes
+from dhos_services_api.helpers.responses import (
+    QueryResponse,
+    by_created,
+    response_to_dict,
+)
 from dhos_services_api.models.diagnosis import Diagnosis
 from dhos_services_api.models.history import History
 from dhos_services_api.models.note import Note
 from dhos_services_api.models.pregnancy import Pregnancy
 from dhos_services_api.models.visit import Visit
-from dhos_services_api.neodb import NeomodelIdentifier
+from dhos_services_api.neodb import NeomodelIdentifier, db, register_warmup_query
 
 _MARKER: Any = object()
 
+_RECORD_RELATIONS_QUERY = register_warmup_query(
+    """
+MATCH (r:Record {uuid:$uuid})
+OPTIONAL MATCH (r)-[:HAS_HISTORY]->(h:History)
+OPTIONAL MATCH (r)-[:HAS_NOTE]->(n:Note)
+WITH r, h, collect(n) AS notes
+OPTIONAL MATCH (r)-[:HAS_DIAGNOSIS]->(d:Diagnosis)
+WITH r, h, notes, collect(d) AS diagnoses
+OPTIONAL MATCH (r)-[:HAS_PREGNANCY]->(p:Pregnancy)
+WITH r, h, notes, diagnoses, collect(p) AS pregnancies
+OPTIONAL MATCH (r)-[:HAD_VISIT]->(v:Visit)
+RETURN h, notes, diagnoses, pregnancies, collect(v) AS visits
+"""
+)
+
 
 class Record(NeomodelIdentifier, StructuredNode):
     notes = RelationshipTo(".note.Note", "HAS_NOTE")
@@ -40,28 +61,18 @@ class Record(NeomodelIdentifier, StructuredNode):
         obj = cls(*args, **kwargs)
         obj.save()
 
-        history.save()
-        obj.history.connect(history)
-
-        for note in notes:
-            note.save()
-            obj.notes.connect(note)
-
-        for visit in visits:
-            visit.save()
-            obj.visits.connect(visit)
+        create_related_nodes(obj, "history", [history])
 
-        for diagnosis in diagnoses:
-            diagnosis.save()
-            obj.diagnoses.connect(diagnosis)
-
-        for preg in pregnancies:
-            preg.save()
-            obj.pregnancies.connect(preg)
+        # The child nodes are saved by their own new() methods, so only need connecting.
+        connect_nodes(obj, "notes", notes)
+        connect_nodes(obj, "visits", visits)
+        connect_nodes(obj, "diagnoses", diagnoses)
+        connect_nodes(obj, "pregnancies", pregnancies)
 
         return obj
 
     @classmethod
+    @cache
     def schema(cls) -> Dict[str, Dict[str, Any]]:
         return {
             "optional": {
@@ -89,24 +100,26 @@ class Record(NeomodelIdentifier, StructuredNode):
         visits: Iterable[Dict] = (),
         history: Dict = None,
     ) -> Dict:
-        return {
-            "notes": sorted(notes, key=lambda x: x["created"], reverse=True),
-            "diagnoses": sorted(diagnoses, key=lambda x: x["created"], reverse=True),
-            "pregnancies": sorted(
-                pregnancies, key=lambda x: x["created"], reverse=True
-            ),
-            "visits": sorted(visits, key=lambda x: x["created"], reverse=True),
-            "history": history,
-            **self.pack_identifier(),
-        }
+        return self.pack_identifier(
+            {
+                "notes": sorted(notes, key=by_created, reverse=True),
+                "diagnoses": sorted(diagnoses, key=by_created, reverse=True),
+                "pregnancies": sorted(pregnancies, key=by_created, reverse=True),
+                "visits": sorted(visits, key=by_created, reverse=True),
+                "history": history,
+            }
+        )
 
     def to_dict(self) -> Dict[str, Any]:
+        results, meta = db.cypher_query(_RECORD_RELATIONS_QUERY, {"uuid": self.uuid})
+        history, notes, diagnoses, pregnancies, visits = results[0]
+
         return self.to_dict_no_relations(
-            notes=[note.to_dict() for note in self.notes],
-            diagnoses=[diagnosis.to_dict() for diagnosis in self.diagnoses],
-            pregnancies=[pregnancy.to_dict() for pregnancy in self.pregnancies],
-            visits=[visit.to_dict() for visit in self.visits],
-            history=self.history.single().to_dict(),
+            notes=[Note.inflate(note).to_dict() for note in notes],
+            diagnoses=[Diagnosis.inflate(diag).to_dict() for diag in diagnoses],
+            pregnancies=[Pregnancy.inflate(preg).to_dict() for preg in pregnancies],
+            visits=[Visit.inflate(visit).to_dict() for visit in visits],
+            history=History.inflate(history).to_dict() if history is not None else None,
         )
 
     def to_compact_dict(
@@ -125,13 +138,12 @@ class Record(NeomodelIdentifier, StructuredNode):
                 pregnancy.to_compact_dict() for pregnancy in self.pregnancies
             ]
 
-        return {
-            "diagnoses": sorted(diagnoses, key=lambda x: x["created"], reverse=True),
-            "pregnancies": sorted(
-                pregnancies, key=lambda x: x["created"], reverse=True
-            ),
-            **self.compack_identifier(),
-        }
+        return self.compack_identifier(
+            {
+                "diagnoses": sorted(diagnoses, key=by_created, reverse=True),
+                "pregnancies": sorted(pregnancies, key=by_created, reverse=True),
+            }
+        )
 
     @classmethod
     def convert_response_to_dict(cls, response: QueryResponse, method: str) -> Dict:
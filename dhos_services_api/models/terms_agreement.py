@@ -1,12 +1,43 @@
 from datetime import datetime
+from functools import cache
 from typing import Any, Dict, Union
 
-from flask_batteries_included.helpers import schema, timestamp
+from flask_batteries_included.helpers import schema
+from flask_batteries_included.helpers.timestamp import join_timestamp, split_timestamp
 from neomodel import DateTimeProperty, IntegerProperty, StringProperty, StructuredNode
 
 from dhos_services_api.neodb import NeomodelIdentifier
 
 
+class _TimestampWithOffset:
+    """
+    A timestamp stored as a UTC `<name>_` datetime plus a `<name>_tz` offset in seconds.
+    Accepts a datetime (taken as UTC), an ISO8601 string or None.
+    """
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.timestamp_attr = f"{name}_"
+        self.offset_attr = f"{name}_tz"
+
+    def __get__(self, instance: Any, owner: type) -> Any:
+        if instance is None:
+            return self
+        return join_timestamp(
+            getattr(instance, self.timestamp_attr),
+            getattr(instance, self.offset_attr),
+        )
+
+    def __set__(self, instance: Any, value: Union[datetime, str, None]) -> None:
+        if not value:
+            utc_timestamp, offset = None, None
+        elif isinstance(value, datetime):
+            utc_timestamp, offset = value, 0
+        else:
+            utc_timestamp, offset = split_timestamp(value)
+        setattr(instance, self.timestamp_attr, utc_timestamp)
+        setattr(instance, self.offset_attr, offset)
+
+
 class TermsAgreement(NeomodelIdentifier, StructuredNode):
 
     product_name = StringProperty()
@@ -22,70 +53,11 @@ class TermsAgreement(NeomodelIdentifier, StructuredNode):
     patient_notice_accepted_timestamp_ = DateTimeProperty()
     patient_notice_accepted_timestamp_tz = IntegerProperty()
 
-    expand_clinician_created_modified = False
+    accepted_timestamp = _TimestampWithOffset()
+    tou_accepted_timestamp = _TimestampWithOffset()
+    patient_notice_accepted_timestamp = _TimestampWithOffset()
 
-    @property
-    def accepted_timestamp(self) -> datetime:
-        return timestamp.join_timestamp(
-            self.accepted_timestamp_, self.accepted_timestamp_tz
-        )
-
-    @accepted_timestamp.setter
-    def accepted_timestamp(self, value: Union[datetime, str, None]) -> None:
-        if not value:
-            self.accepted_timestamp_ = None
-            self.accepted_timestamp_tz = None
-        elif isinstance(value, datetime):
-            self.accepted_timestamp_ = value
-            self.accepted_timestamp_tz = 0
-        else:
-            (
-                self.accepted_timestamp_,
-                self.accepted_timestamp_tz,
-            ) = timestamp.split_timestamp(value)
-
-    @property
-    def tou_accepted_timestamp(self) -> datetime:
-        return timestamp.join_timestamp(
-            self.tou_accepted_timestamp_, self.tou_accepted_timestamp_tz
-        )
-
-    @tou_accepted_timestamp.setter
-    def tou_accepted_timestamp(self, value: Union[datetime, str, None]) -> None:
-        if not value:
-            self.tou_accepted_timestamp_ = None
-            self.tou_accepted_timestamp_tz = None
-        elif isinstance(value, datetime):
-            self.tou_accepted_timestamp_ = value
-            self.tou_accepted_timestamp_tz = 0
-        else:
-            (
-                self.tou_accepted_timestamp_,
-                self.tou_accepted_timestamp_tz,
-            ) = timestamp.split_timestamp(value)
-
-    @property
-    def patient_notice_accepted_timestamp(self) -> datetime:
-        return timestamp.join_timestamp(
-            self.patient_notice_accepted_timestamp_,
-            self.patient_notice_accepted_timestamp_tz,
-        )
-
-    @patient_notice_accepted_timestamp.setter
-    def patient_notice_accepted_timestamp(
-        self, value: Union[datetime, str, None]
-    ) -> None:
-        if not value:
-            self.patient_notice_accepted_timestamp_ = None
-            self.patient_notice_accepted_timestamp_tz = None
-        elif isinstance(value, datetime):
-            self.patient_notice_accepted_timestamp_ = value
-            self.patient_notice_accepted_timestamp_tz = 0
-        else:
-            (
-                self.patient_notice_accepted_timestamp_,
-                self.patient_notice_accepted_timestamp_tz,
-            ) = timestamp.split_timestamp(value)
+    expand_clinician_created_modified = False
 
     @classmethod
     def new(cls, *args: Any, **kwargs: Any) -> "TermsAgreement":
@@ -117,6 +89,7 @@ class TermsAgreement(NeomodelIdentifier, StructuredNode):
         return obj
 
     @classmethod
+    @cache
     def schema(cls) -> Dict[str, Dict[str, type]]:
         return {
             "optional": {
@@ -134,38 +107,25 @@ class TermsAgreement(NeomodelIdentifier, StructuredNode):
         }
 
     def to_dict(self) -> Dict[str, Any]:
-        result = {
-            "product_name": self.product_name,
-            **self.pack_identifier(),
-        }
+        result = self.pack_identifier({"product_name": self.product_name})
         if self.version:
-            result.update(
-                {
-                    "version": self.version,
-                    "accepted_timestamp": self.accepted_timestamp.isoformat(
-                        timespec="milliseconds"
-                    ),
-                }
+            result["version"] = self.version
+            result["accepted_timestamp"] = self.accepted_timestamp.isoformat(
+                timespec="milliseconds"
             )
 
         if self.tou_version:
-            result.update(
-                {
-                    "tou_version": self.tou_version,
-                    "tou_accepted_timestamp": self.tou_accepted_timestamp.isoformat(
-                        timespec="milliseconds"
-                    ),
-                }
+            result["tou_version"] = self.tou_version
+            result["tou_accepted_timestamp"] = self.tou_accepted_timestamp.isoformat(
+                timespec="milliseconds"
             )
 
         if self.patient_notice_version:
-            result.update(
-                {
-                    "patient_notice_version": self.patient_notice_version,
-                    "patient_notice_accepted_timestamp": self.patient_notice_accepted_timestamp.isoformat(
-                        timespec="milliseconds"
-                    ),
-                }
+            result["patient_notice_version"] = self.patient_notice_version
+            result[
+                "patient_notice_accepted_timestamp"
+            ] = self.patient_notice_accepted_timestamp.isoformat(
+                timespec="milliseconds"
             )
 
         return result
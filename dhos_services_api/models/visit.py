@@ -1,4 +1,5 @@
 from datetime import datetime
+from functools import cache
 from typing import Dict, List, Optional
 
 from flask_batteries_included.helpers import schema
@@ -13,7 +14,7 @@ from neomodel import (
 )
 
 import dhos_services_api.models.patient
-from dhos_services_api.helpers.neo_utils import get_node_or_404
+from dhos_services_api.helpers.neo_utils import connect_nodes, get_nodes_or_404
 from dhos_services_api.helpers.responses import (
     QueryResponse,
     response_to_dict,
@@ -21,7 +22,22 @@ from dhos_services_api.helpers.responses import (
     validate_uuid_list,
 )
 from dhos_services_api.models.diagnosis import Diagnosis
-from dhos_services_api.neodb import NeomodelIdentifier, db
+from dhos_services_api.neodb import NeomodelIdentifier, db, register_warmup_query
+
+_VISIT_PATIENT_QUERY = register_warmup_query(
+    """
+MATCH (p:Patient)-[:HAS_RECORD]-(r:Record)-[:HAD_VISIT]-(v:Visit {uuid:$uuid})
+RETURN p
+LIMIT 1
+"""
+)
+
+_VISIT_RECORD_QUERY = register_warmup_query(
+    """
+MATCH (r:Record)-[:HAD_VISIT]-(v:Visit {uuid:$uuid})
+RETURN r
+"""
+)
 
 
 class Visit(NeomodelIdentifier, StructuredNode):
@@ -46,34 +62,19 @@ class Visit(NeomodelIdentifier, StructuredNode):
 
     @property
     def patient(self) -> Optional["dhos_services_api.models.patient.Patient"]:
-        query = """
-        match(p:Patient)-[:HAS_RECORD]-(r:Record)
-        where r.uuid = {uuid}
-        return p  
-        """
-        record = self.record
-        if record is None:
-            return None
-
-        results, meta = db.cypher_query(query, {"uuid": record.single().uuid})
+        results, meta = db.cypher_query(_VISIT_PATIENT_QUERY, {"uuid": self.uuid})
         return (
             dhos_services_api.models.patient.Patient.inflate(results[0][0])
-            if len(results[0]) > 0
+            if results
             else None
         )
 
     @property
     def record(self) -> Optional["dhos_services_api.models.record.Record"]:
-        query = """
-        match(r:Record)-[:HAD_VISIT]-(v:Visit)
-        where v.uuid = {uuid}
-        return r
-        """
-
-        results, meta = db.cypher_query(query, {"uuid": self.uuid})
+        results, meta = db.cypher_query(_VISIT_RECORD_QUERY, {"uuid": self.uuid})
         return (
             dhos_services_api.models.record.Record.inflate(results[0][0])
-            if len(results[0]) > 0
+            if results
             else None
         )
 
@@ -84,16 +85,17 @@ class Visit(NeomodelIdentifier, StructuredNode):
 
         diagnoses_uuids: List = kwargs.pop("diagnoses", [])  # type: ignore
 
+        diagnoses = get_nodes_or_404(Diagnosis, diagnoses_uuids)
+
         obj = cls(*args, **kwargs)
         obj.save()
 
-        for diagnoses_uuid in diagnoses_uuids:
-            diagnosis = get_node_or_404(Diagnosis, uuid=diagnoses_uuid)
-            obj.diagnoses.connect(diagnosis)
+        connect_nodes(obj, "diagnoses", diagnoses)
 
         return obj
 
     @classmethod
+    @cache
     def schema(cls) -> Dict:
         return {
             "optional": {"summary": str, "diagnoses": [dict]},
@@ -111,24 +113,18 @@ class Visit(NeomodelIdentifier, StructuredNode):
         self,
         diagnoses: List[str] = None,
     ) -> Dict:
-        return {
-            "visit_date": self.visit_date,
-            "summary": self.summary,
-            "location": self.location,
-            "diagnoses": diagnoses,
-            "clinician_uuid": self.clinician_uuid,
-            **self.pack_identifier(),
-        }
+        return self.pack_identifier(
+            {
+                "visit_date": self.visit_date,
+                "summary": self.summary,
+                "location": self.location,
+                "diagnoses": diagnoses,
+                "clinician_uuid": self.clinician_uuid,
+            }
+        )
 
     def to_dict(self) -> Dict:
-        return {
-            "visit_date": self.visit_date,
-            "summary": self.summary,
-            "location": self.location,
-            "diagnoses": [d.uuid for d in self.diagnoses],
-            "clinician_uuid": self.clinician_uuid,
-            **self.pack_identifier(),
-        }
+        return self.to_dict_no_relations(diagnoses=[d.uuid for d in self.diagnoses])
 
     @classmethod
     def convert_response_to_dict(cls, response: QueryResponse, method: str) -> Dict:
@@ -1,18 +1,15 @@
 import logging
-from datetime import datetime, timezone
-from typing import Any, Dict, Optional, Tuple, Union
+from datetime import date, datetime, timezone
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
 from uuid import uuid4
 
 import neomodel
 from flask import Flask
 from flask_batteries_included.blueprint_monitoring import healthcheck
 from flask_batteries_included.helpers.security.jwt import current_jwt_user
-from flask_batteries_included.helpers.timestamp import (
-    parse_datetime_to_iso8601,
-    parse_iso8601_to_datetime,
-)
 from neobolt.exceptions import TransientError
-from neomodel import Database, DateTimeProperty, StringProperty, db
+from neomodel import Database, DateProperty, DateTimeProperty, StringProperty, db
+from neomodel.properties import validator
 from she_logging import logger
 from tenacity import (
     retry,
@@ -21,8 +18,15 @@ from tenacity import (
     wait_exponential,
 )
 
+from dhos_services_api.helpers.dates import (
+    parse_datetime_to_iso8601,
+    parse_iso8601_to_datetime,
+)
+
 logging.getLogger("neo4j.bolt").setLevel(logging.WARNING)
 
+_WARMUP_QUERIES: List[str] = []
+
 
 def enable_retry(database: Database = db) -> None:
     # https://sensynehealth.atlassian.net/browse/PLAT-841
@@ -49,6 +53,28 @@ def init_db(app: Flask, testing: bool = False) -> None:
         # Only add db healthchecks if not testing
         healthcheck.add_check(database_connectivity_test)
         enable_retry()
+        warm_up_query_cache()
+
+
+def register_warmup_query(query: str) -> str:
+    """
+    Registers a frequently used query to be planned when the app starts, so the first
+    request to use it doesn't pay the planning cost. Returns the query unchanged.
+    """
+    _WARMUP_QUERIES.append(query)
+    return query
+
+
+def warm_up_query_cache() -> None:
+    """
+    Plans the registered queries with EXPLAIN, which caches them without running them.
+    A query that fails to plan is logged and skipped, the rest are still warmed up.
+    """
+    for query in _WARMUP_QUERIES:
+        try:
+            db.cypher_query(f"EXPLAIN {query}")
+        except Exception:
+            logger.warning("Failed to warm up query cache", exc_info=True)
 
 
 def database_connectivity_test() -> Tuple[bool, str]:
@@ -61,6 +87,25 @@ def database_connectivity_test() -> Tuple[bool, str]:
     return True, "Database ok"
 
 
+class IsoDateProperty(DateProperty):
+    """
+    Stores a date in the same YYYY-MM-DD form as `neomodel.DateProperty`, but inflates
+    it with date.fromisoformat() rather than the much slower datetime.strptime().
+    """
+
+    @validator
+    def inflate(self, value: Any) -> date:
+        return date.fromisoformat(str(value))
+
+    if TYPE_CHECKING:
+        # Untyped neomodel properties are Any to mypy; keep this one the same on nodes.
+        def __get__(self, instance: Any, owner: Any) -> Any:
+            ...
+
+        def __set__(self, instance: Any, value: Any) -> None:
+            ...
+
+
 class NeomodelIdentifier:
     """
     This class is designed to be used by classes extending `neomodel.StructuredNode`. It provides
@@ -76,12 +121,16 @@ class NeomodelIdentifier:
     created_: Optional[datetime] = DateTimeProperty(
         default_now=True, db_property="created"
     )
-    created_by_: str = StringProperty(default=current_jwt_user)
+    created_by: str = StringProperty(
+        default=current_jwt_user, db_property="created_by_"
+    )
 
     modified_: Optional[datetime] = DateTimeProperty(
         default_now=True, db_property="modified"
     )
-    modified_by_: str = StringProperty(default=current_jwt_user)
+    modified_by: str = StringProperty(
+        default=current_jwt_user, db_property="modified_by_"
+    )
 
     def pre_save(self) -> None:
         """
@@ -89,7 +138,7 @@ class NeomodelIdentifier:
         creating a new relationship via connect(). Updates the `modified` and
         `modified_by` fields.
         """
-        self.modified = datetime.utcnow()
+        self.modified_ = datetime.utcnow()
         self.modified_by = current_jwt_user()
 
     def on_patch(self, *args: Any, **kwargs: Any) -> None:
@@ -97,7 +146,7 @@ class NeomodelIdentifier:
         Kept only to avoid breaking changes - the pre_save() hook above, which is
         called automatically, has deprecated this function.
         """
-        self.modified = datetime.utcnow()
+        self.modified_ = datetime.utcnow()
         self.modified_by = current_jwt_user()
 
     @property
@@ -126,30 +175,23 @@ class NeomodelIdentifier:
         else:
             self.modified_ = parse_iso8601_to_datetime(value)
 
-    @property
-    def created_by(self) -> str:
-        return self.created_by_
-
-    @created_by.setter
-    def created_by(self, v: str) -> None:
-        self.created_by_ = v
-
-    @property
-    def modified_by(self) -> str:
-        return self.modified_by_
-
-    @modified_by.setter
-    def modified_by(self, v: str) -> None:
-        self.modified_by_ = v
-
-    def pack_identifier(self) -> Dict:
-        return {
-            "uuid": self.uuid,
-            "created": self.created,
-            "created_by": self.created_by,
-            "modified": self.modified,
-            "modified_by": self.modified_by,
-        }
-
-    def compack_identifier(self) -> Dict:
-        return {"created": self.created, "uuid": self.uuid}
+    def pack_identifier(self, result: Optional[Dict] = None) -> Dict:
+        """
+        Adds the identifier fields to `result` (or a new dict) and returns it, so
+        to_dict() methods can pass their own dict in rather than unpacking a copy.
+        """
+        if result is None:
+            result = {}
+        result["uuid"] = self.uuid
+        result["created"] = self.created
+        result["created_by"] = self.created_by
+        result["modified"] = self.modified
+        result["modified_by"] = self.modified_by
+        return result
+
+    def compack_identifier(self, result: Optional[Dict] = None) -> Dict:
+        if result is None:
+            result = {}
+        result["created"] = self.created
+        result["uuid"] = self.uuid
+        return result
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 from typing import Any
 
 from flask_batteries_included.sqldb import db
@@ -19,7 +20,7 @@ class Delivery(ModelIdentifier, db.Model):
 
     birth_outcome = db.Column(db.String)
     outcome_for_baby = db.Column(db.String)
-    neonatal_complications = db.Column(db.JSON, default=[])
+    neonatal_complications = db.Column(db.JSON, default=list)
     neonatal_complications_other = db.Column(db.String)
     admitted_to_special_baby_care_unit = db.Column(db.Boolean)
     birth_weight_in_grams = db.Column(db.Integer)
@@ -30,7 +31,9 @@ class Delivery(ModelIdentifier, db.Model):
     date_of_termination = db.Column(db.Date, nullable=True)
 
     patient_id = db.Column(db.String, db.ForeignKey("patient.uuid"), index=True)
-    patient = db.relationship("Patient", backref="delivery", uselist=False)
+    patient = db.relationship(
+        "Patient", back_populates="delivery", uselist=False, lazy="joined"
+    )
 
     @classmethod
     def new(
@@ -40,10 +43,8 @@ class Delivery(ModelIdentifier, db.Model):
         patient: dict | sqlmodels.Patient | None = None,
         **kwargs: Any,
     ) -> "Delivery":
-        if "patient_id" not in kwargs:
-            kwargs["patient"] = construct_single_child(
-                {} if patient is None else patient, sqlmodels.Patient
-            )
+        if "patient_id" not in kwargs and patient is not None:
+            kwargs["patient"] = construct_single_child(patient, sqlmodels.Patient)
 
         self = cls(
             pregnancy_id=pregnancy_id,
@@ -54,6 +55,7 @@ class Delivery(ModelIdentifier, db.Model):
         return self
 
     @classmethod
+    @functools.cache
     def schema(cls) -> ValidationSchema:
         return {
             "optional": {
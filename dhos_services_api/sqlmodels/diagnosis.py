@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 from typing import Any, Sequence
 
 from flask_batteries_included.sqldb import db
@@ -27,11 +28,13 @@ class Diagnosis(ModelIdentifier, db.Model):
     presented = db.Column(db.Date)
     episode = db.Column(db.Integer)
 
-    diagnosis_tool: list[str] = db.Column(db.JSON, default=[])
+    diagnosis_tool: list[str] = db.Column(db.JSON, default=list)
     diagnosis_tool_other = db.Column(db.String)
 
-    risk_factors: list[str] = db.Column(db.JSON, default=[])
+    risk_factors: list[str] = db.Column(db.JSON, default=list)
 
+    # Lazy by default: responses preload this through the query_options_* functions in
+    # sqlmodels/patient.py rather than per diagnosis.
     management_plan = db.relationship(
         "ManagementPlan", uselist=False, cascade="all, delete-orphan"
     )
@@ -70,6 +73,7 @@ class Diagnosis(ModelIdentifier, db.Model):
         return self
 
     @classmethod
+    @functools.cache
     def schema(cls) -> ValidationSchema:
         return {
             "optional": {
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 from typing import Any, Sequence
 
 from flask_batteries_included.sqldb import db
@@ -23,10 +24,12 @@ class Dose(ModelIdentifier, db.Model):
         db.ForeignKey("management_plan.uuid", ondelete="SET NULL"),
         nullable=True,
     )
+    management_plan = db.relationship("ManagementPlan", back_populates="doses")
     medication_id = db.Column(db.String)
     dose_amount = db.Column(db.Float)
     routine_sct_code = db.Column(db.String)
 
+    # Lazy by default: joinedload via query_options_full_patient_response.
     changes = db.relationship(
         "DoseChange", order_by="desc(DoseChange.created)", cascade="all, delete-orphan"
     )
@@ -70,6 +73,7 @@ class Dose(ModelIdentifier, db.Model):
         return self
 
     @classmethod
+    @functools.cache
     def schema(cls) -> ValidationSchema:
         return {
             "optional": {"routine_sct_code": str},
@@ -92,15 +96,23 @@ class Dose(ModelIdentifier, db.Model):
         medication_change: str | None = None
         new_dose: str | None = None
         routine_sct_code_change: str | None = None
+        changed = False
 
         if medication_id != self.medication_id:
             self.medication_id = medication_change = medication_id
+            changed = True
 
         if dose_amount != self.dose_amount:
             self.dose_amount = new_dose = dose_amount
+            changed = True
 
         if routine_sct_code != self.routine_sct_code:
             self.routine_sct_code = routine_sct_code_change = routine_sct_code
+            changed = True
+
+        if not changed:
+            # Nothing changed, so there is no change to record.
+            return
 
         DoseChange.new(
             dose_id=self.uuid,
@@ -113,7 +125,6 @@ class Dose(ModelIdentifier, db.Model):
     def on_delete(self, parent: sqlmodels.ManagementPlan) -> None:
         parent.add_history(self, "delete")
         self.management_plan_id = None
-        db.session.add(self)
 
 
 class DoseChange(ModelIdentifier, db.Model):
@@ -132,6 +143,7 @@ class DoseChange(ModelIdentifier, db.Model):
         return self
 
     @classmethod
+    @functools.cache
     def schema(cls) -> ValidationSchema:
         return {
             "optional": {
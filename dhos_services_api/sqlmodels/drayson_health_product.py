@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from datetime import datetime
+import functools
+from datetime import date
 from enum import Enum
 from typing import Any, Optional, Sequence
 
@@ -28,20 +29,20 @@ class DraysonHealthProduct(ModelIdentifier, db.Model):
         db.String, db.ForeignKey("patient.uuid", ondelete="CASCADE"), nullable=False
     )
 
+    patient = db.relationship("Patient", back_populates="dh_products")
+
     product_name = db.Column(db.String, nullable=False)
-    opened_date = db.Column(db.Date, nullable=True, default=datetime.now().date)
+    opened_date = db.Column(db.Date, nullable=True, default=date.today)
     closed_date = db.Column(db.Date, nullable=True, default=None)
     closed_reason = db.Column(db.String, nullable=True)
     closed_reason_other = db.Column(db.String, nullable=True)
 
     def pack_base_product(self) -> dict[str, Optional[str]]:
-
-        return {
-            "product_name": self.product_name,
-            "opened_date": self.opened_date,
-            "closed_date": self.closed_date,
-            **self.pack_identifier(),
-        }
+        result = self.pack_identifier()
+        result["product_name"] = self.product_name
+        result["opened_date"] = self.opened_date
+        result["closed_date"] = self.closed_date
+        return result
 
     accessibility_discussed = db.Column(db.Boolean, nullable=False, default=False)
     accessibility_discussed_with = db.Column(db.String, nullable=True)
@@ -49,12 +50,23 @@ class DraysonHealthProduct(ModelIdentifier, db.Model):
 
     monitored_by_clinician = db.Column(db.Boolean, nullable=False, default=True)
     # N.B. Changes are sorted oldest first.
+    # Lazy by default: joinedload via query_options_full_patient_response.
     changes = db.relationship(
         "DraysonHealthProductChange",
         order_by="asc(DraysonHealthProductChange.created)",
         cascade="all, delete-orphan",
     )
 
+    __table_args__ = (
+        db.Index("product_by_patient_index", "patient_id", "product_name"),
+        db.Index(
+            "open_product_by_patient_index",
+            "patient_id",
+            "product_name",
+            postgresql_where=closed_date == None,
+        ),
+    )
+
     @classmethod
     def new(
         cls,
@@ -73,6 +85,7 @@ class DraysonHealthProduct(ModelIdentifier, db.Model):
         return self
 
     @classmethod
+    @functools.cache
     def schema(cls) -> ValidationSchema:
         return {
             "optional": {
@@ -106,16 +119,22 @@ class DraysonHealthProduct(ModelIdentifier, db.Model):
 
         product_name = _json.get("product_name", None)
         if product_name is not None and product_name != self.product_name:
-            query = db.session.query(DraysonHealthProduct).filter(
-                DraysonHealthProduct.patient_id == self.patient_id,
-                DraysonHealthProduct.product_name == product_name,
-                DraysonHealthProduct.closed_date == None,
+            already_open = (
+                db.session.query(DraysonHealthProduct.uuid)
+                .filter(
+                    DraysonHealthProduct.patient_id == self.patient_id,
+                    DraysonHealthProduct.product_name == product_name,
+                    DraysonHealthProduct.closed_date == None,
+                )
+                .exists()
             )
-            if query.first() is not None:
+            if db.session.query(already_open).scalar():
                 abort(400, f"patient is already active on {_json['product_name']}")
 
         super().on_patch()
 
+    # close(), stop_monitoring() and start_monitoring() only change the session, the
+    # caller commits once they have all been applied.
     def close(
         self,
         closed_date: str,
@@ -130,20 +149,14 @@ class DraysonHealthProduct(ModelIdentifier, db.Model):
             self.stop_monitoring()
 
         self._new_event(event=DraysonHealthProductChangeEvent.ARCHIVE)
-        db.session.add(self)
-        db.session.commit()
 
     def stop_monitoring(self) -> None:
         self.monitored_by_clinician = False
-        db.session.add(self)
         self._new_event(event=DraysonHealthProductChangeEvent.STOP_MONITORING)
-        db.session.commit()
 
     def start_monitoring(self) -> None:
         self.monitored_by_clinician = True
-        db.session.add(self)
         self._new_event(event=DraysonHealthProductChangeEvent.START_MONITORING)
-        db.session.commit()
 
 
 class DraysonHealthProductChange(ModelIdentifier, db.Model):
@@ -163,6 +176,7 @@ class DraysonHealthProductChange(ModelIdentifier, db.Model):
         return self
 
     @classmethod
+    @functools.cache
     def schema(cls) -> ValidationSchema:
         return {
             "optional": {},
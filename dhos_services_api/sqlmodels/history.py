@@ -1,3 +1,4 @@
+import functools
 from typing import Any
 
 from flask_batteries_included.sqldb import db
@@ -20,6 +21,7 @@ class History(ModelIdentifier, db.Model):
         return self
 
     @classmethod
+    @functools.cache
     def schema(cls) -> ValidationSchema:
         return {
             "optional": {"parity": int, "gravidity": int},
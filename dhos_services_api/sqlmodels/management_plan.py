@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 from typing import Any, Sequence
 
 from flask_batteries_included.helpers.security.jwt import current_jwt_user
@@ -18,8 +19,9 @@ class ManagementPlan(ModelIdentifier, db.Model):
         db.String, db.ForeignKey("diagnosis.uuid", ondelete="CASCADE"), nullable=False
     )
 
+    # Lazy by default: selectinload via query_options_full_patient_response.
     doses = db.relationship(
-        "Dose", order_by="desc(Dose.created)", backref="management_plan"
+        "Dose", order_by="desc(Dose.created)", back_populates="management_plan"
     )
     actions = db.relationship(
         "NonMedicationAction",
@@ -31,7 +33,7 @@ class ManagementPlan(ModelIdentifier, db.Model):
         order_by="desc(DoseHistory.created)",
         cascade="all, delete-orphan",
     )
-    plan_history: list[str] = db.Column(db.JSON, default=[])
+    plan_history: list[str] = db.Column(db.JSON, default=list)
     start_date = db.Column(db.Date, nullable=True)
     end_date = db.Column(db.Date, nullable=True)
     sct_code = db.Column(db.String, nullable=False)
@@ -56,21 +58,26 @@ class ManagementPlan(ModelIdentifier, db.Model):
             )
             db.session.add(self)
 
+            clinician_uuid = current_jwt_user()
             for dose in self.doses:
-                self.add_history(dose, "insert")
+                self.add_history(dose, "insert", clinician_uuid=clinician_uuid)
 
         return self
 
-    def add_history(self, dose: sqlmodels.Dose, action: str) -> None:
-        dose_history = DoseHistory.new(
+    def add_history(
+        self, dose: sqlmodels.Dose, action: str, clinician_uuid: str | None = None
+    ) -> None:
+        if clinician_uuid is None:
+            clinician_uuid = current_jwt_user()
+        DoseHistory.new(
             management_plan_id=self.uuid,
-            clinician_uuid=current_jwt_user(),
+            clinician_uuid=clinician_uuid,
             dose_id=dose.uuid,
             action=action,
         )
-        db.session.add(self)
 
     @classmethod
+    @functools.cache
     def schema(cls) -> ValidationSchema:
         return {
             "optional": {
@@ -134,6 +141,7 @@ class DoseHistory(ModelIdentifier, db.Model):
         return self
 
     @classmethod
+    @functools.cache
     def schema(cls) -> ValidationSchema:
         return {
             "optional": {
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 from abc import abstractmethod
 from datetime import datetime
 from typing import Any, Sequence, Type, TypeVar, Union
@@ -74,6 +75,7 @@ class ModelIdentifier(sqldb.ModelIdentifier):
         super().__init__(**kwargs)
 
     @classmethod
+    @functools.cache
     def schema(cls) -> ValidationSchema:
         raise NotImplementedError()
 
@@ -86,6 +88,8 @@ class ModelIdentifier(sqldb.ModelIdentifier):
     def recursive_patch(self, **kwargs: Any) -> None:
         """Simple patching of values on a model. Override if the model has relationships"""
         self.on_patch(kwargs)
+        if not kwargs:
+            return
 
         for key, new_value in kwargs.items():
             if key in self._no_patch:
@@ -107,11 +111,12 @@ class ModelIdentifier(sqldb.ModelIdentifier):
                     raise TypeError("list elements should be strings")
 
                 model_item_list = getattr(self, key)
+                existing = set(model_item_list)
                 setattr(
                     self,
                     key,
                     model_item_list
-                    + [item for item in new_value if item not in model_item_list],
+                    + [item for item in new_value if item not in existing],
                 )
             else:
                 setattr(self, key, new_value)
@@ -146,7 +151,7 @@ class ModelIdentifier(sqldb.ModelIdentifier):
             raise TypeError("list elements should be either dicts or uuid strings")
 
         if new_connections:
-            db.session.query(cls).filter(cls.uuid.in_(patch_data)).update(
+            db.session.query(cls).filter(cls.uuid.in_(new_connections)).update(
                 {related_column: parent_id}
             )
 
@@ -160,7 +165,7 @@ class ModelIdentifier(sqldb.ModelIdentifier):
             )
             for obj in query:
                 patch = updated_models[obj.uuid]
-                obj.recursive_patch(**{k: patch[k] for k in patch.keys() - {"uuid"}})
+                obj.recursive_patch(**{k: v for k, v in patch.items() if k != "uuid"})
 
     def recursive_delete(self, **kwargs: object) -> None:
         """
@@ -186,25 +191,26 @@ class ModelIdentifier(sqldb.ModelIdentifier):
             if not isinstance(value, (list, tuple)):
                 continue
 
-            delete_str = [v for v in value if isinstance(v, str)] + [
-                v["uuid"] for v in value if isinstance(v, dict) and v.keys() == {"uuid"}
-            ]
-            delete_dicts = {
-                v["uuid"]: v
-                for v in value
-                if isinstance(v, dict) and v.keys() > {"uuid"}
-            }
-
-            if not len(delete_str) + len(delete_dicts) == len(value):
-                raise TypeError(
-                    "Can only delete from a list of strings or objects with a uuid"
-                )
+            delete_str: list[str] = []
+            delete_dicts: dict[str, dict] = {}
+            for v in value:
+                if isinstance(v, str):
+                    delete_str.append(v)
+                elif isinstance(v, dict) and v.keys() == {"uuid"}:
+                    delete_str.append(v["uuid"])
+                elif isinstance(v, dict) and v.keys() > {"uuid"}:
+                    delete_dicts[v["uuid"]] = v
+                else:
+                    raise TypeError(
+                        "Can only delete from a list of strings or objects with a uuid"
+                    )
+            delete_set = set(delete_str)
 
             # make sure the key exists on the model
             if not hasattr(self, key):
                 raise KeyError(f"{self.__table__.name} does not have attribute: {key}")
 
-            if key in self.__table__.columns.keys():
+            if key in self.__table__.columns:
                 old_value = getattr(self, key)
                 if isinstance(old_value, (list, tuple)):
                     if delete_dicts:
@@ -213,17 +219,17 @@ class ModelIdentifier(sqldb.ModelIdentifier):
                         )
 
                     # list of strings (e.g. snomed codes, external uuids)
-                    setattr(self, key, [v for v in old_value if v not in delete_str])
+                    setattr(self, key, [v for v in old_value if v not in delete_set])
                     continue
 
             if delete_str:
                 # Must be list of uuids for related items
                 old_value = getattr(self, key)
                 children_to_notify: list[ModelIdentifier] = [
-                    child for child in old_value if child.uuid in delete_str
+                    child for child in old_value if child.uuid in delete_set
                 ]
 
-                setattr(self, key, [v for v in old_value if v.uuid not in delete_str])
+                setattr(self, key, [v for v in old_value if v.uuid not in delete_set])
                 for child in children_to_notify:
                     child.on_delete(parent=self)
 
@@ -232,11 +238,11 @@ class ModelIdentifier(sqldb.ModelIdentifier):
                     if obj.uuid in delete_dicts:
                         patch = delete_dicts[obj.uuid]
                         obj.recursive_delete(
-                            **{k: patch[k] for k in patch.keys() - {"uuid"}}
+                            **{k: v for k, v in patch.items() if k != "uuid"}
                         )
         db.session.add(self)
 
-    _no_patch = ["uuid", "created", "modified", "bookmarked", "closed_date"]
+    _no_patch = frozenset({"uuid", "created", "modified", "bookmarked", "closed_date"})
 
 
 T = TypeVar("T", bound=ModelIdentifier)
@@ -1,3 +1,4 @@
+import functools
 from typing import Any
 
 from flask_batteries_included.sqldb import db
@@ -25,6 +26,7 @@ class NonMedicationAction(ModelIdentifier, db.Model):
         return self
 
     @classmethod
+    @functools.cache
     def schema(cls) -> ValidationSchema:
         return {
             "optional": {},
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 from typing import Any
 
 from flask_batteries_included.sqldb import db
@@ -20,7 +21,7 @@ class ObservableEntity(ModelIdentifier, db.Model):
     sct_code = db.Column(db.String)
     date_observed = db.Column(db.Date)
     value_as_string = db.Column(db.String)
-    metadata_ = db.Column(db.JSON, default={}, nullable=False)
+    metadata_ = db.Column(db.JSON, default=dict, nullable=False)
 
     @classmethod
     def new(
@@ -31,12 +32,13 @@ class ObservableEntity(ModelIdentifier, db.Model):
         **kwargs: Any,
     ) -> "ObservableEntity":
         if metadata is not _SENTINEL:
-            kwargs["metadata_"] = metadata or {}
+            kwargs["metadata_"] = metadata if metadata is not None else {}
         self = cls(diagnosis_id=diagnosis_id, **kwargs)
         db.session.add(self)
         return self
 
     @classmethod
+    @functools.cache
     def schema(cls) -> ValidationSchema:
         return {
             "optional": {"metadata": dict, "value_as_string": str},
@@ -56,5 +58,5 @@ class ObservableEntity(ModelIdentifier, db.Model):
         **kwargs: object,
     ) -> None:
         if metadata is not _SENTINEL:
-            kwargs["metadata_"] = metadata or {}
+            kwargs["metadata_"] = metadata if metadata is not None else {}
         super().recursive_patch(**kwargs)
@@ -6,7 +6,7 @@ from typing import Any, Sequence
 from flask_batteries_included.sqldb import db
 from sqlalchemy import and_, true
 from sqlalchemy.dialects import postgresql
-from sqlalchemy.orm import Load, Query, aliased, joinedload, subqueryload
+from sqlalchemy.orm import Load, Query, aliased, joinedload, selectinload
 
 from dhos_services_api import sqlmodels
 from dhos_services_api.sqlmodels import DraysonHealthProduct
@@ -21,13 +21,11 @@ _MARKER: Any = object()
 
 
 def merge_schemas(x: ValidationSchema, y: ValidationSchema) -> ValidationSchema:
-    merged = x.copy()
-
-    merged["optional"].update(y["optional"])
-    merged["required"].update(y["required"])
-    merged["updatable"].update(y["updatable"])
-
-    return merged
+    return {
+        "optional": x["optional"] | y["optional"],
+        "required": x["required"] | y["required"],
+        "updatable": x["updatable"] | y["updatable"],
+    }
 
 
 class Patient(ModelIdentifier, db.Model):
@@ -71,18 +69,18 @@ class Patient(ModelIdentifier, db.Model):
 
     # Notes
     accessibility_considerations: list[str] = db.Column(
-        db.JSON, default=[], nullable=False
+        db.JSON, default=list, nullable=False
     )
     accessibility_considerations_other = db.Column(db.String, nullable=True)
 
     other_notes = db.Column(db.String, nullable=True)
-    locations = db.Column(postgresql.ARRAY(db.String), default=[])
-    bookmarked_at_locations = db.Column(postgresql.ARRAY(db.String), default=[])
+    locations = db.Column(postgresql.ARRAY(db.String), default=list)
+    bookmarked_at_locations = db.Column(postgresql.ARRAY(db.String), default=list)
     has_been_bookmarked = db.Column(db.Boolean, default=False)
 
     @property
     def bookmarked(self) -> bool:
-        return len(self.bookmarked_at_locations) > 0
+        return bool(self.bookmarked_at_locations)
 
     # Related notes
     record_id = db.Column(
@@ -100,9 +98,12 @@ class Patient(ModelIdentifier, db.Model):
 
     # Products patient is attached to
     dh_products = db.relationship(
-        "DraysonHealthProduct", backref="patient", cascade="all, delete-orphan"
+        "DraysonHealthProduct", back_populates="patient", cascade="all, delete-orphan"
     )
 
+    # The delivery a baby was born from
+    delivery = db.relationship("Delivery", back_populates="patient")
+
     terms_agreement = db.relationship(
         "TermsAgreement",
         cascade="all, delete-orphan",
@@ -112,7 +113,7 @@ class Patient(ModelIdentifier, db.Model):
     )
 
     parent_patient_id = db.Column(
-        db.String, db.ForeignKey("patient.uuid", ondelete="SET NULL")
+        db.String, db.ForeignKey("patient.uuid", ondelete="SET NULL"), index=True
     )
     child_of = db.relationship("Patient", remote_side="Patient.uuid", uselist=False)
 
@@ -166,6 +167,7 @@ class Patient(ModelIdentifier, db.Model):
         return self
 
     @classmethod
+    @functools.cache
     def patient_validate_schema(cls) -> ValidationSchema:
         # ** This is used by the /patient/validate endpoint **
         # TODO this probably needs a better place to live...
@@ -181,6 +183,7 @@ class Patient(ModelIdentifier, db.Model):
         }
 
     @classmethod
+    @functools.cache
     def shared_schema(cls) -> ValidationSchema:
         return {
             "optional": {
@@ -232,6 +235,7 @@ class Patient(ModelIdentifier, db.Model):
         }
 
     @classmethod
+    @functools.cache
     def gdm_exclusive_schema(cls) -> ValidationSchema:
         return {
             "optional": {"dod": str, "fhir_resource_id": str},
@@ -248,10 +252,12 @@ class Patient(ModelIdentifier, db.Model):
         }
 
     @classmethod
+    @functools.cache
     def gdm_schema(cls) -> ValidationSchema:
         return merge_schemas(cls.shared_schema(), cls.gdm_exclusive_schema())
 
     @classmethod
+    @functools.cache
     def send_dod_exclusive_schema(cls) -> ValidationSchema:
         return {
             "optional": {
@@ -262,10 +268,12 @@ class Patient(ModelIdentifier, db.Model):
         }
 
     @classmethod
+    @functools.cache
     def send_dod_schema(cls) -> ValidationSchema:
         return merge_schemas(cls.send_schema(), cls.send_dod_exclusive_schema())
 
     @classmethod
+    @functools.cache
     def send_exclusive_schema(cls) -> ValidationSchema:
         return {
             "optional": {
@@ -284,6 +292,7 @@ class Patient(ModelIdentifier, db.Model):
         }
 
     @classmethod
+    @functools.cache
     def send_schema(cls) -> ValidationSchema:
         return merge_schemas(cls.shared_schema(), cls.send_exclusive_schema())
 
@@ -350,38 +359,38 @@ class SendPatient(Patient):
 def query_options_full_patient_response() -> list[Load]:
     """Preload response data for a query that returns a PatientResponse"""
     record = joinedload(Patient.record)
-    notes = record.subqueryload(sqlmodels.Record.notes)
-    diagnoses = record.subqueryload(sqlmodels.Record.diagnoses)
-    observable_entities = diagnoses.subqueryload(
+    notes = record.selectinload(sqlmodels.Record.notes)
+    diagnoses = record.selectinload(sqlmodels.Record.diagnoses)
+    observable_entities = diagnoses.selectinload(
         sqlmodels.Diagnosis.observable_entities
     )
-    management_plan = diagnoses.subqueryload(sqlmodels.Diagnosis.management_plan)
-    management_plan_actions = management_plan.subqueryload(
+    management_plan = diagnoses.selectinload(sqlmodels.Diagnosis.management_plan)
+    management_plan_actions = management_plan.selectinload(
         sqlmodels.ManagementPlan.actions
     )
-    management_plan_doses = management_plan.subqueryload(
+    management_plan_doses = management_plan.selectinload(
         sqlmodels.ManagementPlan.doses
     ).joinedload(sqlmodels.Dose.changes)
     management_plan_dose_history = (
-        management_plan.subqueryload(sqlmodels.ManagementPlan.dose_history)
+        management_plan.selectinload(sqlmodels.ManagementPlan.dose_history)
         .joinedload(sqlmodels.DoseHistory.dose)
         .joinedload(sqlmodels.Dose.changes)
     )
-    readings_plan_with_changes = diagnoses.subqueryload(
+    readings_plan_with_changes = diagnoses.selectinload(
         sqlmodels.Diagnosis.readings_plan
     ).joinedload(sqlmodels.ReadingsPlan.changes)
-    pregnancies = record.subqueryload(sqlmodels.Record.pregnancies)
-    deliveries = pregnancies.subqueryload(sqlmodels.Pregnancy.deliveries).joinedload(
+    pregnancies = record.selectinload(sqlmodels.Record.pregnancies)
+    deliveries = pregnancies.selectinload(sqlmodels.Pregnancy.deliveries).joinedload(
         sqlmodels.Delivery.patient
     )
-    visits = record.subqueryload(sqlmodels.Record.visits)
+    visits = record.selectinload(sqlmodels.Record.visits)
     history = record.joinedload(sqlmodels.Record.history)
 
-    dh_products = subqueryload(Patient.dh_products).joinedload(
+    dh_products = selectinload(Patient.dh_products).joinedload(
         sqlmodels.DraysonHealthProduct.changes
     )
-    addresses = subqueryload(Patient.personal_addresses)
-    terms_agreement = subqueryload(Patient.terms_agreement)
+    addresses = selectinload(Patient.personal_addresses)
+    terms_agreement = selectinload(Patient.terms_agreement)
 
     options: list[Load] = [
         notes,
@@ -407,13 +416,13 @@ def query_options_full_patient_response() -> list[Load]:
 def query_options_compact_patient_response() -> list[Load]:
     """Preload response data for a query that returns a CompactPatientResponse"""
     record = joinedload(Patient.record)
-    diagnoses = record.subqueryload(sqlmodels.Record.diagnoses)
-    management_plan = diagnoses.subqueryload(sqlmodels.Diagnosis.management_plan)
-    pregnancies = record.subqueryload(sqlmodels.Record.pregnancies)
-    deliveries = pregnancies.subqueryload(sqlmodels.Pregnancy.deliveries).joinedload(
+    diagnoses = record.selectinload(sqlmodels.Record.diagnoses)
+    management_plan = diagnoses.selectinload(sqlmodels.Diagnosis.management_plan)
+    pregnancies = record.selectinload(sqlmodels.Record.pregnancies)
+    deliveries = pregnancies.selectinload(sqlmodels.Pregnancy.deliveries).joinedload(
         sqlmodels.Delivery.patient
     )
-    dh_products = subqueryload(Patient.dh_products)
+    dh_products = selectinload(Patient.dh_products)
     options: list[Load] = [
         record,
         diagnoses,
@@ -429,11 +438,11 @@ def query_options_compact_patient_response() -> list[Load]:
 def query_options_patient_list() -> list[Load]:
     """Preload response data for a query that returns a PatientDiabetesResponse"""
     record = joinedload(Patient.record)
-    diagnoses = record.subqueryload(sqlmodels.Record.diagnoses)
-    readings_plan_with_changes = diagnoses.subqueryload(
+    diagnoses = record.selectinload(sqlmodels.Record.diagnoses)
+    readings_plan_with_changes = diagnoses.selectinload(
         sqlmodels.Diagnosis.readings_plan
     ).joinedload(sqlmodels.ReadingsPlan.changes)
-    dh_products = subqueryload(Patient.dh_products)
+    dh_products = selectinload(Patient.dh_products)
 
     options: list[Load] = [record, diagnoses, readings_plan_with_changes, dh_products]
     return options
@@ -470,6 +479,7 @@ def query_top_level_patients(query: Query) -> Query:
     return parent_query
 
 
+@functools.lru_cache(maxsize=32)
 def filter_patient_active_on_product(
     product_name: str, active_only: bool = False
 ) -> Any:
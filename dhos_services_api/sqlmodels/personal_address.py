@@ -1,3 +1,4 @@
+import functools
 from datetime import date
 from typing import Any
 
@@ -24,6 +25,7 @@ class PersonalAddress(ModelIdentifier, AddressMixin, db.Model):
         return self
 
     @classmethod
+    @functools.cache
     def schema(cls) -> ValidationSchema:
         return {
             "optional": {
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 from typing import Any, Sequence
 
 from flask_batteries_included.sqldb import db
@@ -21,7 +22,7 @@ class Pregnancy(ModelIdentifier, db.Model):
     length_of_postnatal_stay_in_days = db.Column(db.Integer)
     colostrum_harvesting = db.Column(db.Boolean)
     expected_number_of_babies = db.Column(db.Integer)
-    pregnancy_complications: list[str] = db.Column(db.JSON, default=[])
+    pregnancy_complications: list[str] = db.Column(db.JSON, default=list)
 
     induced = db.Column(db.Boolean)
 
@@ -57,6 +58,7 @@ class Pregnancy(ModelIdentifier, db.Model):
         return self
 
     @classmethod
+    @functools.cache
     def schema(cls) -> ValidationSchema:
         return {
             "optional": {
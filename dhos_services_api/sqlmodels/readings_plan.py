@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 from typing import Any
 
 from flask_batteries_included.sqldb import db
@@ -97,6 +98,7 @@ class ReadingsPlan(ModelIdentifier, db.Model):
         super(ReadingsPlan, self).on_patch()
 
     @classmethod
+    @functools.cache
     def schema(cls) -> ValidationSchema:
         return {
             "optional": {
@@ -135,6 +137,7 @@ class ReadingsPlanChange(ModelIdentifier, db.Model):
         return self
 
     @classmethod
+    @functools.cache
     def schema(cls) -> ValidationSchema:
         return {
             "optional": {
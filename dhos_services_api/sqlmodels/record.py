@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 from typing import Any, Sequence
 
 from flask_batteries_included.sqldb import db
@@ -63,6 +64,7 @@ class Record(ModelIdentifier, db.Model):
         return self
 
     @classmethod
+    @functools.cache
     def schema(cls) -> ValidationSchema:
         return {
             "optional": {
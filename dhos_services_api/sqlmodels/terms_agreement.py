@@ -1,3 +1,4 @@
+import functools
 from typing import Any
 
 from flask_batteries_included.sqldb import db
@@ -8,7 +9,10 @@ from dhos_services_api.sqlmodels.mixins import ModelIdentifier, ValidationSchema
 
 class TermsAgreement(ModelIdentifier, db.Model):
     patient_id = db.Column(
-        db.String, db.ForeignKey("patient.uuid", ondelete="CASCADE"), nullable=False
+        db.String,
+        db.ForeignKey("patient.uuid", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
     )
 
     product_name = db.Column(db.String)
@@ -34,6 +38,7 @@ class TermsAgreement(ModelIdentifier, db.Model):
         return self
 
     @classmethod
+    @functools.cache
     def schema(cls) -> ValidationSchema:
         return {
             "optional": {
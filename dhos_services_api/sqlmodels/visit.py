@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 from typing import Any
 
 from flask_batteries_included.sqldb import db
@@ -15,7 +16,7 @@ class Visit(ModelIdentifier, db.Model):
 
     # Ideally this would be an array of foreignkey references to diagnosis.uuid but Postgres doesn't yet have
     # foreignkey arrays.
-    diagnoses = db.Column(postgresql.ARRAY(db.String), default=[])
+    diagnoses = db.Column(postgresql.ARRAY(db.String), default=list)
 
     # Says it's a date, but its actually a datetimem.
     visit_date = db.Column(db.DateTime(timezone=True))
@@ -32,6 +33,7 @@ class Visit(ModelIdentifier, db.Model):
         return self
 
     @classmethod
+    @functools.cache
     def schema(cls) -> ValidationSchema:
         return {
             "optional": {"summary": str, "diagnoses": [dict]},
@@ -0,0 +1,27 @@
+"""patient parent index
+
+Revision ID: 4e1f0c2ab7d6
+Revises: b9879cbadd38
+Create Date: 2026-10-16 09:12:47.503118
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "4e1f0c2ab7d6"
+down_revision = "b9879cbadd38"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index(
+        op.f("ix_patient_parent_patient_id"),
+        "patient",
+        ["parent_patient_id"],
+        unique=False,
+    )
+
+
+def downgrade():
+    op.drop_index(op.f("ix_patient_parent_patient_id"), table_name="patient")
@@ -0,0 +1,27 @@
+"""product by patient index
+
+Revision ID: 7c3d9e5a2f18
+Revises: d2a7c61f0b94
+Create Date: 2026-10-16 10:41:09.873412
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "7c3d9e5a2f18"
+down_revision = "d2a7c61f0b94"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index(
+        "product_by_patient_index",
+        "drayson_health_product",
+        ["patient_id", "product_name"],
+        unique=False,
+    )
+
+
+def downgrade():
+    op.drop_index("product_by_patient_index", table_name="drayson_health_product")
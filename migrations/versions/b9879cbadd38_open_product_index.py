@@ -0,0 +1,29 @@
+"""open product index
+
+Revision ID: b9879cbadd38
+Revises: 9b57875239bb
+Create Date: 2026-10-15 23:30:12.418305
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "b9879cbadd38"
+down_revision = "9b57875239bb"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index(
+        "open_product_by_patient_index",
+        "drayson_health_product",
+        ["patient_id", "product_name"],
+        unique=False,
+        postgresql_where=sa.text("closed_date IS NULL"),
+    )
+
+
+def downgrade():
+    op.drop_index("open_product_by_patient_index", table_name="drayson_health_product")
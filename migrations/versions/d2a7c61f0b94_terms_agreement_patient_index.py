@@ -0,0 +1,27 @@
+"""terms agreement patient index
+
+Revision ID: d2a7c61f0b94
+Revises: 4e1f0c2ab7d6
+Create Date: 2026-10-16 10:04:31.227690
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "d2a7c61f0b94"
+down_revision = "4e1f0c2ab7d6"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index(
+        op.f("ix_terms_agreement_patient_id"),
+        "terms_agreement",
+        ["patient_id"],
+        unique=False,
+    )
+
+
+def downgrade():
+    op.drop_index(op.f("ix_terms_agreement_patient_id"), table_name="terms_agreement")
@@ -0,0 +1,88 @@
+from datetime import date, datetime, timedelta, timezone
+from typing import Optional
+
+import pytest
+from flask_batteries_included.helpers import timestamp
+
+from dhos_services_api.helpers.dates import (
+    parse_date_to_iso8601,
+    parse_datetime_to_iso8601,
+    parse_iso8601_to_date,
+    parse_iso8601_to_datetime,
+)
+
+
+class TestDates:
+    @pytest.mark.parametrize(
+        "value,expected",
+        [
+            (None, None),
+            ("", None),
+            ("2020-01-31", date(2020, 1, 31)),
+            ("2020-1-5", date(2020, 1, 5)),
+        ],
+    )
+    def test_parse_iso8601_to_date(
+        self, value: Optional[str], expected: Optional[date]
+    ) -> None:
+        assert parse_iso8601_to_date(value) == expected
+
+    @pytest.mark.parametrize("value", ["2020-02-30", "31/01/2020", "not a date"])
+    def test_parse_iso8601_to_date_invalid(self, value: str) -> None:
+        with pytest.raises(ValueError):
+            parse_iso8601_to_date(value)
+
+    @pytest.mark.parametrize(
+        "value,expected", [(None, None), (date(2020, 1, 5), "2020-01-05")]
+    )
+    def test_parse_date_to_iso8601(
+        self, value: Optional[date], expected: Optional[str]
+    ) -> None:
+        assert parse_date_to_iso8601(value) == expected
+
+    @pytest.mark.parametrize(
+        "value",
+        [
+            None,
+            datetime(2020, 1, 5, 10, 11, 12, 123456, tzinfo=timezone.utc),
+            datetime(2020, 1, 5, 10, 11, 12, tzinfo=timezone(timedelta(hours=1))),
+            datetime(
+                2020, 1, 5, 10, 11, 12, 5000, tzinfo=timezone(-timedelta(hours=5))
+            ),
+            datetime(2020, 1, 5, 10, 11, 12, 999999),
+        ],
+    )
+    def test_parse_datetime_to_iso8601(self, value: Optional[datetime]) -> None:
+        assert parse_datetime_to_iso8601(value) == timestamp.parse_datetime_to_iso8601(
+            value
+        )
+
+    @pytest.mark.parametrize(
+        "value",
+        [
+            None,
+            "",
+            "2000-01-01T01:01:01.123Z",
+            "2000-01-01T01:01:01.123+01:00",
+            "2000-01-01T01:01:01.123456-05:30",
+            "2000-01-01T01:01:01.1Z",
+        ],
+    )
+    def test_parse_iso8601_to_datetime(self, value: Optional[str]) -> None:
+        assert parse_iso8601_to_datetime(value) == timestamp.parse_iso8601_to_datetime(
+            value
+        )
+
+    @pytest.mark.parametrize(
+        "value",
+        [
+            "2000-01-01 01:01:01.123Z",
+            "2000-01-01T01:01:01Z",
+            "2000-01-01T01:01:01.123",
+            "2000-13-01T01:01:01.123Z",
+            "not a datetime",
+        ],
+    )
+    def test_parse_iso8601_to_datetime_invalid(self, value: str) -> None:
+        with pytest.raises(ValueError):
+            parse_iso8601_to_datetime(value)
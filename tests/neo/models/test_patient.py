@@ -1,10 +1,15 @@
 import uuid
+from datetime import date
 from typing import Callable, Dict, List
 
 import pytest
 from neomodel import UniqueProperty
 
-from dhos_services_api.models.patient import _latest_terms_agreement
+from dhos_services_api.models.patient import (
+    Patient,
+    _latest_terms_agreement,
+    _years_before,
+)
 from dhos_services_api.models.terms_agreement import TermsAgreement
 
 
@@ -148,3 +153,22 @@ class TestPatient:
                 assert latest_terms is not None
                 for key in expected:
                     assert expected[key] == latest_terms[key]
+
+    @pytest.mark.parametrize(
+        "today,expected",
+        [
+            (date(2020, 6, 15), date(2004, 6, 15)),
+            (date(2021, 2, 28), date(2005, 2, 28)),
+            (date(2024, 2, 29), date(2008, 2, 29)),
+        ],
+    )
+    def test_years_before(self, today: date, expected: date) -> None:
+        assert _years_before(today, 16) == expected
+
+    def test_years_before_leap_day(self) -> None:
+        assert _years_before(date(2024, 2, 29), 17) == date(2007, 2, 28)
+
+    def test_merged_schemas_do_not_leak(self) -> None:
+        assert "dod" in Patient.send_dod_schema()["optional"]
+        assert "dod" not in Patient.send_schema()["optional"]
+        assert Patient.gdm_schema() is Patient.gdm_schema()
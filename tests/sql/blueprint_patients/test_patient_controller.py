@@ -21,6 +21,7 @@ from dhos_services_api.models.api_spec import (
     PatientResponse,
     PatientTermsResponseV2,
 )
+from dhos_services_api.sqlmodels import Patient, pydantic_models
 from dhos_services_api.sqlmodels.patient import (
     query_options_compact_patient_response,
     query_options_full_patient_response,
@@ -282,6 +283,33 @@ class TestPatientController:
         assert patient_data["first_name"] == "Carol"
         assert_valid_schema(PatientResponse, patient_data)
 
+    @pytest.mark.parametrize(
+        "query_options,response_model",
+        [
+            (query_options_full_patient_response, pydantic_models.PatientResponse),
+            (
+                query_options_compact_patient_response,
+                pydantic_models.CompactPatientResponse,
+            ),
+            (query_options_patient_list, pydantic_models.PatientDiabetesResponse),
+        ],
+    )
+    def test_query_options_preload_response(
+        self,
+        _db: SQLAlchemy,
+        patient_with_delivery_uuid: str,
+        with_raiseload: Callable,
+        query_options: Callable,
+        response_model: Any,
+    ) -> None:
+        _db.session.expunge_all()
+        patient = (
+            Patient.query.filter(Patient.uuid == patient_with_delivery_uuid)
+            .options(*with_raiseload(query_options()))
+            .one()
+        )
+        assert response_model.from_orm(patient).uuid == patient_with_delivery_uuid
+
     @pytest.mark.parametrize(
         "compact,schema,limit",
         [
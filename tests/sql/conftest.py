@@ -9,7 +9,7 @@ import pytest
 import sqlalchemy
 from flask_batteries_included.sqldb import db
 from flask_sqlalchemy import SQLAlchemy
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Load, Session, raiseload
 
 from dhos_services_api.sqlmodels import Patient
 
@@ -73,6 +73,24 @@ def statement_counter() -> Callable[
     return db_statement_counter
 
 
+@pytest.fixture
+def with_raiseload() -> Callable[[list[Load]], list[Load]]:
+    """
+    Extend a list of query options so that any relationship they do not preload raises
+    instead of being lazily loaded, turning a missed option into a test failure rather
+    than a hidden N+1 query.
+    """
+
+    def extend(options: list[Load]) -> list[Load]:
+        return [
+            *options,
+            *(option.raiseload("*", sql_only=True) for option in options),
+            raiseload("*", sql_only=True),
+        ]
+
+    return extend
+
+
 @pytest.fixture
 def patient_context(_db: SQLAlchemy, location_uuid: str, clinician: str) -> Callable:
     from dhos_services_api.sqlmodels.patient import Patient, SendPatient
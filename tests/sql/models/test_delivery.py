@@ -0,0 +1,17 @@
+import pytest
+
+from dhos_services_api.sqlmodels import Delivery
+
+
+@pytest.mark.usefixtures("app", "uses_sql_database")
+class TestDelivery:
+    def test_new_without_patient(self) -> None:
+        delivery = Delivery.new(pregnancy_id=None)
+        assert delivery.patient is None
+
+    def test_new_with_patient(self) -> None:
+        delivery = Delivery.new(
+            pregnancy_id=None, patient={"first_name": "Paul", "last_name": "Smith"}
+        )
+        assert delivery.patient is not None
+        assert delivery.patient.first_name == "Paul"
@@ -3,6 +3,7 @@ from typing import Optional
 import pytest
 from flask_sqlalchemy import SQLAlchemy
 
+from dhos_services_api.sqlmodels import Patient
 from dhos_services_api.sqlmodels.dose import Dose
 from dhos_services_api.sqlmodels.pydantic_models import DoseResponse
 
@@ -83,3 +84,88 @@ class TestDose:
                 },
             ],
         }
+
+
+@pytest.mark.usefixtures("app", "uses_sql_database")
+def test_on_patch_without_changes(_db: SQLAlchemy) -> None:
+    dose_details: dict = {
+        "medication_id": "original_med",
+        "dose_amount": 1.5,
+        "routine_sct_code": "abc",
+    }
+    dose_uuid: str = Dose.new(management_plan_id=None, **dose_details).uuid
+    _db.session.flush()
+    original_dose: Optional[Dose] = _db.session.get(Dose, dose_uuid)
+    assert original_dose is not None
+    original_dose.on_patch(dict(dose_details))
+    _db.session.flush()
+    updated_dose: Optional[Dose] = _db.session.get(Dose, dose_uuid)
+    assert updated_dose is not None
+    assert updated_dose.changes == []
+
+
+@pytest.mark.usefixtures("app", "uses_sql_database")
+@pytest.mark.parametrize(
+    "dose_update,expected_change",
+    [
+        (
+            {"routine_sct_code": None},
+            {"medication_id": None, "dose_amount": None, "routine_sct_code": None},
+        ),
+        (
+            {"dose_amount": 2.5, "routine_sct_code": None},
+            {"medication_id": None, "dose_amount": 2.5, "routine_sct_code": None},
+        ),
+    ],
+)
+def test_on_patch_clearing_routine_sct_code(
+    _db: SQLAlchemy, dose_update: dict, expected_change: dict
+) -> None:
+    dose_details: dict = {
+        "medication_id": "original_med",
+        "dose_amount": 1.5,
+        "routine_sct_code": "abc",
+    }
+    dose_uuid: str = Dose.new(management_plan_id=None, **dose_details).uuid
+    _db.session.flush()
+    original_dose: Optional[Dose] = _db.session.get(Dose, dose_uuid)
+    assert original_dose is not None
+    original_dose.on_patch(dose_update)
+    _db.session.flush()
+    updated_dose: Optional[Dose] = _db.session.get(Dose, dose_uuid)
+    assert updated_dose is not None
+    assert updated_dose.routine_sct_code is None
+    assert len(updated_dose.changes) == 1
+    change = updated_dose.changes[0]
+    assert {
+        "medication_id": change.medication_id,
+        "dose_amount": change.dose_amount,
+        "routine_sct_code": change.routine_sct_code,
+    } == expected_change
+
+
+@pytest.mark.usefixtures("app", "uses_sql_database", "jwt_system")
+def test_patch_related_objects_with_uuids_and_new_doses(
+    _db: SQLAlchemy, patient: Patient
+) -> None:
+    management_plan_uuid: str = patient.record.diagnoses[0].management_plan.uuid
+    existing_uuid: str = Dose.new(
+        management_plan_id=None,
+        medication_id="existing_med",
+        dose_amount=1.5,
+        routine_sct_code="abc",
+    ).uuid
+    _db.session.flush()
+    Dose.patch_related_objects(
+        related_column=Dose.management_plan_id,
+        parent_id=management_plan_uuid,
+        patch_data=[
+            existing_uuid,
+            {"medication_id": "new_med", "dose_amount": 2.5, "routine_sct_code": "def"},
+        ],
+    )
+    _db.session.flush()
+    doses = (
+        _db.session.query(Dose).filter(Dose.management_plan_id == management_plan_uuid)
+    ).all()
+    assert {dose.medication_id for dose in doses} == {"existing_med", "new_med"}
@@ -0,0 +1,24 @@
+from datetime import date
+
+import pytest
+from neomodel import DateProperty
+from neomodel.exceptions import InflateError
+
+from dhos_services_api.neodb import IsoDateProperty
+
+
+class TestIsoDateProperty:
+    @pytest.mark.parametrize("value", ["2000-02-29", "1985-12-01", "2020-01-31"])
+    def test_matches_date_property(self, value: str) -> None:
+        prop = IsoDateProperty()
+        assert prop.inflate(value) == DateProperty().inflate(value)
+        assert prop.deflate(prop.inflate(value)) == value
+
+    def test_inflate_invalid(self) -> None:
+        prop = IsoDateProperty()
+        prop.name, prop.owner = "dob_", object
+        with pytest.raises(InflateError):
+            prop.inflate("01/12/1985")
+
+    def test_inflate_returns_date(self) -> None:
+        assert IsoDateProperty().inflate("1985-12-01") == date(1985, 12, 1)
@@ -0,0 +1,32 @@
+from mock import Mock, call
+from pytest_mock import MockerFixture
+
+from dhos_services_api import neodb
+
+
+class TestNeodbWarmup:
+    def test_register_warmup_query(self, mocker: MockerFixture) -> None:
+        mocker.patch.object(neodb, "_WARMUP_QUERIES", [])
+        query = "MATCH (n:Node {uuid:$uuid}) RETURN n"
+        assert neodb.register_warmup_query(query) is query
+        assert neodb._WARMUP_QUERIES == [query]
+
+    def test_warm_up_query_cache(self, mocker: MockerFixture) -> None:
+        mocker.patch.object(neodb, "_WARMUP_QUERIES", ["QUERY 1", "QUERY 2"])
+        mock_query: Mock = mocker.patch.object(neodb.db, "cypher_query")
+        neodb.warm_up_query_cache()
+        assert mock_query.call_args_list == [
+            call("EXPLAIN QUERY 1"),
+            call("EXPLAIN QUERY 2"),
+        ]
+
+    def test_warm_up_query_cache_failure(self, mocker: MockerFixture) -> None:
+        mocker.patch.object(neodb, "_WARMUP_QUERIES", ["QUERY 1", "QUERY 2"])
+        mock_query: Mock = mocker.patch.object(
+            neodb.db, "cypher_query", side_effect=[ConnectionError, ([], None)]
+        )
+        neodb.warm_up_query_cache()
+        assert mock_query.call_args_list == [
+            call("EXPLAIN QUERY 1"),
+            call("EXPLAIN QUERY 2"),
+        ]